@@ -0,0 +1,90 @@
+"""Compare per-article spaCy NER against the batched nlp.pipe topic extraction.
+
+The baseline is per-article NER with the full ``en_core_web_sm`` pipeline
+(nothing excluded), i.e. the topics the app produced before batching; the
+batched topics must match it exactly.
+
+Usage (from the repository root):
+    python -m benchmarks.bench_ner --articles 300 --batch-size 64
+"""
+import argparse
+import os
+import time
+
+import pandas as pd
+import spacy
+
+from src.models import SPACY_MODEL, get_nlp
+from src.analysis import _topics_from_doc, extract_topics_batch, extract_topics_ner
+from src.utils import DATA_DIR
+
+
+def load_corpus(n_articles):
+    """Repeat the bundled sample articles until the corpus has n_articles rows.
+
+    Every repeat is suffixed so all texts are distinct: ``extract_topics_batch``
+    analyzes repeated texts once, which would otherwise be timed as batching.
+    """
+    df = pd.read_csv(os.path.join(DATA_DIR, "Amazon_news.csv"))
+    repeats = -(-n_articles // len(df))
+    copies = []
+    for copy in range(repeats):
+        df_copy = df.copy()
+        if copy:
+            df_copy["Title"] = df_copy["Title"] + f" (copy {copy})"
+            df_copy["Summary"] = df_copy["Summary"].fillna("") + f" (copy {copy})"
+        copies.append(df_copy)
+    return pd.concat(copies, ignore_index=True).head(n_articles)
+
+
+def per_row_topics(titles, summaries, extract):
+    return [set(extract(t)) | set(extract(s)) for t, s in zip(titles, summaries)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--articles", type=int, default=300)
+    parser.add_argument("--batch-size", type=int, default=64)
+    parser.add_argument("--n-process", type=int, default=1)
+    args = parser.parse_args()
+
+    df = load_corpus(args.articles)
+    titles, summaries = list(df["Title"]), list(df["Summary"])
+    assert len(set(titles + summaries)) == 2 * len(df), "Corpus texts must be distinct"
+
+    # Load both pipelines up front so model loading is not timed
+    full_nlp = spacy.load(SPACY_MODEL)
+    get_nlp()
+
+    def extract_full(text):
+        if pd.isnull(text) or text.strip() == "":
+            return []
+        return _topics_from_doc(full_nlp(text))
+
+    start = time.perf_counter()
+    baseline = per_row_topics(titles, summaries, extract_full)
+    baseline_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    per_row = per_row_topics(titles, summaries, extract_topics_ner)
+    per_row_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    topics = extract_topics_batch(titles + summaries, batch_size=args.batch_size, n_process=args.n_process)
+    batched = [set(topics[i]) | set(topics[len(df) + i]) for i in range(len(df))]
+    batched_seconds = time.perf_counter() - start
+
+    assert per_row == baseline, "NER-only pipeline produced different topics than the full pipeline"
+    assert batched == baseline, "Batched NER produced different topics than the full pipeline"
+
+    n = len(df)
+    print(f"Articles:              {n} (distinct texts: {2 * n})")
+    print(f"Per-row, full model:   {baseline_seconds:.3f}s ({baseline_seconds / n * 1000:.2f} ms/article)")
+    print(f"Per-row, NER only:     {per_row_seconds:.3f}s ({per_row_seconds / n * 1000:.2f} ms/article)")
+    print(f"Batched nlp.pipe:      {batched_seconds:.3f}s ({batched_seconds / n * 1000:.2f} ms/article)")
+    print(f"Speedup vs full model: {baseline_seconds / batched_seconds:.2f}x")
+    print(f"Speedup from batching: {per_row_seconds / batched_seconds:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,323 @@
+"""Offline benchmark of every pipeline stage against fixture feeds.
+
+Feeds are served from a local HTTP stand-in (no live RSS endpoints) and TTS
+uses the offline backend (no gTTS). Each stage of run_pipeline is timed
+separately over several repetitions for corpora of 30, 300 and 3,000
+articles, each in a fresh process so its peak RSS is its own, and the
+results are written as JSON so they can be compared between commits.
+
+Usage (from the repository root):
+    python -m benchmarks.run_benchmarks
+    python -m benchmarks.run_benchmarks --sizes 30 300 --repeat 5
+    python -m benchmarks.run_benchmarks --fixtures path/to/recorded_xml/
+    python -m benchmarks.run_benchmarks --compare benchmarks/results/<old>.json
+"""
+import argparse
+import glob
+import json
+import multiprocessing
+import os
+import platform
+import resource
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from xml.sax.saxutils import escape
+
+import numpy as np
+import pandas as pd
+
+from src import analysis, utils
+from src.audio_store import AudioStore, OfflineTTSBackend
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+RESULTS_DIR = os.path.join(BENCH_DIR, "results")
+SAMPLE_CSV = os.path.join(utils.DATA_DIR, "Amazon_news.csv")
+COMPANY = "Amazon"
+ITEMS_PER_FEED = 50
+STAGES = ["download", "parse", "keyword_filter", "near_dedup", "clean", "sentiment", "ner", "overlap_coverage", "tts", "report_write"]
+
+
+# ============================
+# Fixture Feeds
+# ============================
+def build_fixture_feeds(n_articles):
+    """Build RSS documents with n_articles items from the recorded sample articles."""
+    sample = pd.read_csv(SAMPLE_CSV).fillna("")
+    items = []
+    for i in range(n_articles):
+        row = sample.iloc[i % len(sample)]
+        # Suffix repeats so titles stay unique (exact-title de-duplication)
+        title = row["Title"] if i < len(sample) else f"{row['Title']} (#{i // len(sample)})"
+        items.append(
+            "<item>"
+            f"<title>{escape(title)}</title>"
+            f"<description>{escape('<p>' + row['Summary'] + '</p>')}</description>"
+            f"<link>{escape(row['Link'])}?v={i}</link>"
+            f"<pubDate>{escape(row['Published'] or formatdate())}</pubDate>"
+            "</item>"
+        )
+    feeds = {}
+    for start in range(0, len(items), ITEMS_PER_FEED):
+        body = "".join(items[start:start + ITEMS_PER_FEED])
+        feeds[f"/feed{start // ITEMS_PER_FEED}.xml"] = (
+            '<?xml version="1.0" encoding="UTF-8"?><rss version="2.0"><channel>'
+            f"<title>Fixture feed</title>{body}</channel></rss>"
+        ).encode("utf-8")
+    return feeds
+
+
+def load_recorded_feeds(directory):
+    """Load recorded feed XML files (*.xml) from a directory."""
+    feeds = {}
+    for path in sorted(glob.glob(os.path.join(directory, "*.xml"))):
+        with open(path, "rb") as f:
+            feeds[f"/{os.path.basename(path)}"] = f.read()
+    return feeds
+
+
+class FixtureServer:
+    """Local HTTP stand-in serving fixture feeds, with an optional per-request delay."""
+
+    def __init__(self, feeds, delay=0.0):
+        self.feeds = feeds
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                time.sleep(delay)
+                content = server.feeds.get(self.path)
+                if content is None:
+                    self.send_response(404)
+                    self.end_headers()
+                    return
+                self.send_response(200)
+                self.send_header("Content-Type", "application/rss+xml")
+                self.send_header("Content-Length", str(len(content)))
+                self.end_headers()
+                self.wfile.write(content)
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.base_url = f"http://127.0.0.1:{self.httpd.server_address[1]}"
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+
+    @property
+    def urls(self):
+        return [self.base_url + path for path in self.feeds]
+
+    def close(self):
+        self.httpd.shutdown()
+
+
+# ============================
+# Stage Timing
+# ============================
+def reset_caches():
+    """Drop in-process caches so every repetition measures a cold run."""
+    utils.feed_cache.invalidate()
+    analysis.lemmatize_token.cache_clear()
+    with analysis._sentiment_cache_lock:
+        analysis._sentiment_cache.clear()
+
+
+def run_stages(urls, max_articles):
+    """Run every pipeline stage once on the fixture feeds; return {stage: seconds} and the article count."""
+    timings = {}
+
+    def timed(stage, func, *args, **kwargs):
+        start = time.perf_counter()
+        result = func(*args, **kwargs)
+        timings[stage] = time.perf_counter() - start
+        return result
+
+    def download():
+        # Raw HTTP time at the pipeline's fetch concurrency; the feed cache and
+        # circuit breaker of iter_feed_entries are deliberately bypassed
+        with ThreadPoolExecutor(max_workers=utils.FETCH_WORKERS) as pool:
+            return [content for content, _, _ in pool.map(utils.fetch_feed, urls)]
+    contents = timed("download", download)
+    feeds = timed("parse", lambda: [utils.parse_feed_entries(content) for content in contents])
+
+    def keyword_filter():
+        matcher = utils.build_keyword_matcher([COMPANY])
+        seen_titles, batches, total = {}, [], 0
+        for url, entries in zip(urls, feeds):
+            columns, matched = utils._match_entries(entries, url, matcher, seen_titles, max_articles - total)
+            total += matched
+            batches.append(pd.DataFrame(columns, columns=utils.ARTICLE_COLUMNS))
+        return pd.concat(batches, ignore_index=True)
+    df = timed("keyword_filter", keyword_filter)
+
+    def near_dedup():
+        # Index every article without dropping any: the fixtures repeat the sample
+        # articles, and collapsing them would shrink the later stages' corpus
+        duplicates = utils.new_duplicate_index()
+        if duplicates is not None:
+            for title, summary, link, source in zip(df["Title"], df["Summary"], df["Link"], df["Source"]):
+                duplicates.add(utils.article_key(link, title), f"{title}\n{summary}", source)
+    timed("near_dedup", near_dedup)
+
+    cleaned_titles, cleaned_summaries = timed(
+        "clean", lambda: (utils.clean_and_preprocess_batch(df["Title"]), utils.clean_and_preprocess_batch(df["Summary"]))
+    )
+    title_scores = timed("sentiment", lambda: (utils.score_sentiment_batch(cleaned_titles), utils.score_sentiment_batch(cleaned_summaries)))[0]
+    topics = timed("ner", lambda: utils.extract_topics_batch(list(df["Title"]) + list(df["Summary"])))
+
+    labels = utils.sentiment_labels(title_scores["compound"])
+    n = len(df)
+    articles_data = [
+        {
+            "Title": df["Title"].iloc[i],
+            "Summary": df["Summary"].iloc[i],
+            "Sentiment": labels[i],
+            "Sentiment Score": round(float(title_scores["compound"][i]), 4),
+            "Topics": list(dict.fromkeys(topics[i] + topics[n + i])),
+        }
+        for i in range(n)
+    ]
+    topic_overlap, coverage_differences = timed(
+        "overlap_coverage", lambda: (utils.get_topic_overlap(articles_data), utils.generate_coverage_differences(articles_data))
+    )
+
+    distribution = utils.count_sentiments(labels)
+    final_summary, summary_text = utils.build_sentiment_summary(COMPANY, distribution)
+    audio_path = timed("tts", utils.generate_tts, summary_text)
+    timed("report_write", utils.save_final_report, COMPANY, articles_data, topic_overlap, coverage_differences,
+          final_summary, audio_path, distribution)
+    return timings, n
+
+
+def peak_rss_mb():
+    """Peak RSS of this process (one corpus runs per process, see run_corpus)."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in kilobytes on Linux and bytes on macOS
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+def summarize(samples, n_articles):
+    samples = np.asarray(samples)
+    p50 = float(np.percentile(samples, 50))
+    return {
+        "p50_ms": round(p50 * 1000, 3),
+        "p95_ms": round(float(np.percentile(samples, 95)) * 1000, 3),
+        "articles_per_sec": round(n_articles / p50, 1) if p50 > 0 else None,
+    }
+
+
+def benchmark_corpus(feeds, repeat, warm, max_articles):
+    server = FixtureServer(feeds)
+    samples = {stage: [] for stage in STAGES + ["total"]}
+    n_articles = 0
+    try:
+        with tempfile.TemporaryDirectory() as output_dir:
+            utils.OUTPUT_DIR = output_dir
+            utils.audio_store = AudioStore(output_dir, OfflineTTSBackend())
+            for _ in range(repeat):
+                if not warm:
+                    reset_caches()
+                    for name in os.listdir(output_dir):
+                        os.remove(os.path.join(output_dir, name))
+                timings, n_articles = run_stages(server.urls, max_articles)
+                for stage, seconds in timings.items():
+                    samples[stage].append(seconds)
+                samples["total"].append(sum(timings.values()))
+    finally:
+        server.close()
+
+    return {
+        "articles": n_articles,
+        "feeds": len(feeds),
+        "stages": {stage: summarize(values, n_articles) for stage, values in samples.items()},
+        "peak_rss_mb": peak_rss_mb(),
+    }
+
+
+def run_corpus(feeds, repeat, warm, max_articles):
+    """Benchmark one corpus in a fresh spawned process.
+
+    ru_maxrss is a process-lifetime high-water mark, so sharing a process
+    would report the largest earlier corpus for every later one.
+    """
+    with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn")) as pool:
+        return pool.submit(benchmark_corpus, feeds, repeat, warm, max_articles).result()
+
+
+# ============================
+# Reporting
+# ============================
+def git_commit():
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], cwd=BENCH_DIR, text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def print_results(results):
+    for size, corpus in results["corpora"].items():
+        print(f"\n📊 Corpus {size}: {corpus['articles']} articles in {corpus['feeds']} feeds, peak RSS {corpus['peak_rss_mb']} MB")
+        print(f"{'stage':<18}{'p50 ms':>12}{'p95 ms':>12}{'articles/s':>14}")
+        for stage, stats in corpus["stages"].items():
+            print(f"{stage:<18}{stats['p50_ms']:>12.2f}{stats['p95_ms']:>12.2f}{str(stats['articles_per_sec']):>14}")
+
+
+def print_comparison(old, new):
+    print(f"\n🔁 Comparison {old['commit']} → {new['commit']} (p50, negative is faster)")
+    for size, corpus in new["corpora"].items():
+        old_corpus = old["corpora"].get(size)
+        if old_corpus is None:
+            continue
+        print(f"\nCorpus {size}")
+        for stage, stats in corpus["stages"].items():
+            old_stats = old_corpus["stages"].get(stage)
+            if not old_stats or not old_stats["p50_ms"]:
+                continue
+            change = (stats["p50_ms"] - old_stats["p50_ms"]) / old_stats["p50_ms"] * 100
+            print(f"{stage:<18}{old_stats['p50_ms']:>12.2f}{stats['p50_ms']:>12.2f}{change:>+10.1f}%")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[30, 300, 3000])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--warm", action="store_true", help="keep in-process caches between repetitions")
+    parser.add_argument("--fixtures", help="directory of recorded feed XML to replay instead of synthesized feeds")
+    parser.add_argument("--output", help="result file (default: benchmarks/results/<commit>.json)")
+    parser.add_argument("--compare", help="previous result file to compare against")
+    args = parser.parse_args()
+
+    recorded = load_recorded_feeds(args.fixtures) if args.fixtures else None
+    results = {
+        "commit": git_commit(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "python": platform.python_version(),
+        "repeat": args.repeat,
+        "warm": args.warm,
+        "corpora": {},
+    }
+    for size in args.sizes:
+        feeds = recorded or build_fixture_feeds(size)
+        results["corpora"][str(size)] = run_corpus(feeds, args.repeat, args.warm, max_articles=size)
+
+    print_results(results)
+
+    output = args.output or os.path.join(RESULTS_DIR, f"{results['commit']}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=4)
+    print(f"\n✅ Results saved to '{output}'.")
+
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            print_comparison(json.load(f), results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,219 @@
+import hashlib
+import os
+import re
+import threading
+from collections import OrderedDict
+from contextlib import nullcontext
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+from bs4 import BeautifulSoup
+
+from src.models import get_nlp, get_sentiment_analyzer, get_stop_words, get_lemmatizer, get_tokenizer
+
+
+# ============================
+# Text Analysis Stages
+# ============================
+# Cleaning, VADER sentiment and spaCy NER of article titles and summaries.
+# Depends on src.models only, so the NLP pool's worker processes import it
+# without the stores, caches and executors src.utils creates at import time.
+# spaCy, VADER, stopwords and WordNet are loaded lazily on first use (or by
+# src.models.warm_up() at app startup) from the bundled nltk_data/ directory.
+NER_LABELS = {"ORG", "PRODUCT", "GPE", "EVENT"}
+NER_BATCH_SIZE = int(os.getenv("NER_BATCH_SIZE", 64))
+NER_N_PROCESS = int(os.getenv("NER_N_PROCESS", 1))
+
+# Cleaning and Preprocessing Functions
+LEMMA_CACHE_SIZE = int(os.getenv("LEMMA_CACHE_SIZE", 50000))
+NON_ALPHA_PATTERN = re.compile(r"[^a-zA-Z\s]")
+
+def strip_html(text):
+    """Return the visible text of an HTML fragment.
+
+    Text without tags or entities is returned as-is, skipping the HTML
+    parser (whitespace-only text still goes through it, as the parser
+    collapses it).
+    """
+    if "<" not in text and "&" not in text and not text.isspace():
+        return text
+    return BeautifulSoup(text, "html.parser").get_text()
+
+@lru_cache(maxsize=LEMMA_CACHE_SIZE)
+def lemmatize_token(token):
+    """Lemmatize a single token. Shared, bounded cache across requests."""
+    return get_lemmatizer().lemmatize(token)
+
+def _normalize_text(text):
+    # 1. Remove HTML tags
+    text = strip_html(text)
+    
+    # 2. Remove special characters, numbers, and punctuation
+    text = NON_ALPHA_PATTERN.sub("", text).lower().strip()
+    
+    # 3. Tokenize
+    tokens = get_tokenizer()(text)
+    
+    # 4. Remove stopwords and apply lemmatization
+    stop_words = get_stop_words()
+    filtered_tokens = [lemmatize_token(word) for word in tokens if word not in stop_words]
+    
+    # 5. Join tokens back to string
+    return " ".join(filtered_tokens)
+
+def clean_and_preprocess(text):
+    """Clean text by removing HTML tags, special characters, and stopwords."""
+    # Handle NaN or invalid values
+    if pd.isnull(text) or not isinstance(text, str) or text.strip() == "":
+        return ""
+    return _normalize_text(text)
+
+def clean_and_preprocess_batch(texts):
+    """Clean a whole column of texts; each distinct text is normalized once.
+
+    Returns a list aligned with ``texts``, identical to applying
+    ``clean_and_preprocess`` to every element.
+    """
+    normalized = {}
+    cleaned = []
+    for text in texts:
+        if not isinstance(text, str) or text.strip() == "":
+            cleaned.append("")
+            continue
+        if text not in normalized:
+            normalized[text] = _normalize_text(text)
+        cleaned.append(normalized[text])
+    return cleaned
+
+
+#  Perform Sentiment Analysis
+SENTIMENT_THRESHOLD = 0.05
+SENTIMENT_FIELDS = ("compound", "pos", "neg", "neu")
+SENTIMENT_CACHE_SIZE = int(os.getenv("SENTIMENT_CACHE_SIZE", 20000))
+
+# Content-hash keyed LRU of VADER scores, so syndicated headlines that show
+# up again and again are only scored once per process.
+_sentiment_cache = OrderedDict()
+_sentiment_cache_lock = threading.Lock()
+
+def _polarity_scores(text):
+    """Return VADER (compound, pos, neg, neu) for a non-empty text, cached by content hash."""
+    key = hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+    with _sentiment_cache_lock:
+        scores = _sentiment_cache.get(key)
+        if scores is not None:
+            _sentiment_cache.move_to_end(key)
+            return scores
+
+    polarity = get_sentiment_analyzer().polarity_scores(text)
+    scores = tuple(polarity[field] for field in SENTIMENT_FIELDS)
+    with _sentiment_cache_lock:
+        _sentiment_cache[key] = scores
+        if len(_sentiment_cache) > SENTIMENT_CACHE_SIZE:
+            _sentiment_cache.popitem(last=False)
+    return scores
+
+def score_sentiment_batch(texts):
+    """Score a column of texts with VADER.
+
+    Returns a dict of numpy arrays (``compound``, ``pos``, ``neg``, ``neu``)
+    aligned with ``texts``. Empty or missing texts score 0.0 everywhere.
+    """
+    texts = list(texts)
+    scores = np.zeros((len(texts), len(SENTIMENT_FIELDS)))
+    for i, text in enumerate(texts):
+        if isinstance(text, str) and text != "":
+            scores[i] = _polarity_scores(text)
+    return {field: scores[:, j] for j, field in enumerate(SENTIMENT_FIELDS)}
+
+def sentiment_labels(compound):
+    """Vectorized Positive / Negative / Neutral labels from compound scores."""
+    compound = np.asarray(compound, dtype=float)
+    return np.select(
+        [compound >= SENTIMENT_THRESHOLD, compound <= -SENTIMENT_THRESHOLD],
+        ["Positive", "Negative"],
+        default="Neutral",
+    ).astype(object)
+
+def count_sentiments(labels):
+    """Count Positive / Negative / Neutral labels in an array."""
+    labels = np.asarray(labels, dtype=object)
+    return {label: int(np.count_nonzero(labels == label)) for label in ("Positive", "Negative", "Neutral")}
+
+def get_sentiment(text):
+    """Perform sentiment analysis on a given text."""
+    if pd.isnull(text) or text == "":
+        return "Neutral"
+    return sentiment_labels(_polarity_scores(text)[0]).item()
+
+# Extract Topics using NER
+def _topics_from_doc(doc):
+    """Collect entities related to organizations, products, locations, and events."""
+    return list(dict.fromkeys(ent.text for ent in doc.ents if ent.label_ in NER_LABELS))
+
+def extract_topics_ner(text):
+    """Extract relevant topics using spaCy NER."""
+    if pd.isnull(text) or text.strip() == "":
+        return []
+    return _topics_from_doc(get_nlp()(text))
+
+def extract_topics_batch(texts, batch_size=NER_BATCH_SIZE, n_process=NER_N_PROCESS):
+    """Extract topics for many texts at once with ``nlp.pipe``.
+
+    Returns one topic list per input text, in input order. Empty or missing
+    texts get an empty list without being sent through the model, and
+    repeated texts are only analyzed once.
+    """
+    texts = list(texts)
+    # Each distinct text goes through the model once
+    unique = list(dict.fromkeys(text for text in texts if isinstance(text, str) and text.strip() != ""))
+    docs = get_nlp().pipe(unique, batch_size=batch_size, n_process=n_process)
+    unique_topics = {text: _topics_from_doc(doc) for text, doc in zip(unique, docs)}
+    return [list(unique_topics.get(text, [])) if isinstance(text, str) else [] for text in texts]
+
+def _untimed(stage, **attributes):
+    return nullcontext()
+
+def analyze_rows(titles, summaries, progress=None, time_stage=_untimed):
+    """Run cleaning, VADER and NER on raw titles / summaries; one row dict per article.
+
+    ``progress`` is called with each stage name and ``time_stage(stage, **attributes)``
+    is a context manager timing it (see ``src.metrics.time_stage``).
+    """
+    progress = progress or (lambda stage: None)
+    # Step 2: Preprocess and clean the data
+    n = len(titles)
+    progress("clean")
+    with time_stage("clean", articles=n):
+        cleaned_titles = clean_and_preprocess_batch(titles)
+        cleaned_summaries = clean_and_preprocess_batch(summaries)
+
+    # Step 3: Sentiment Analysis (numeric scores)
+    progress("sentiment")
+    with time_stage("sentiment", articles=n):
+        title_scores = score_sentiment_batch(cleaned_titles)
+        summary_scores = score_sentiment_batch(cleaned_summaries)
+
+    # Step 4: Extract Topics (titles and summaries in one batched NER pass)
+    progress("topics")
+    with time_stage("topics", articles=n):
+        topics = extract_topics_batch(list(titles) + list(summaries))
+
+    rows = []
+    for i in range(n):
+        row = {
+            "cleaned_title": cleaned_titles[i],
+            "cleaned_summary": cleaned_summaries[i],
+            "topics": list(dict.fromkeys(topics[i] + topics[n + i])),
+        }
+        for field in SENTIMENT_FIELDS:
+            row[f"title_{field}"] = float(title_scores[field][i])
+            row[f"summary_{field}"] = float(summary_scores[field][i])
+        rows.append(row)
+    return rows
+
+# Worker entry point of the NLP process pool
+def analyze_chunk(titles, summaries):
+    """``analyze_rows`` without progress reporting or stage timing."""
+    return analyze_rows(titles, summaries)
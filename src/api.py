@@ -1,18 +1,61 @@
-from fastapi import FastAPI, HTTPException, BackgroundTasks
+from fastapi import FastAPI, HTTPException, BackgroundTasks, Request
 from pydantic import BaseModel
+from typing import List
 from fastapi.middleware.cors import CORSMiddleware
+from contextlib import asynccontextmanager
+import asyncio
 import logging
-from src.utils import run_pipeline
-from fastapi.responses import FileResponse
+import time
+import uuid
+from src.utils import run_pipeline_many, iter_pipeline, PIPELINE_STAGES, article_store, ARTICLE_STORE_MAX_AGE, nlp_pool, feed_health, audio_store, trend_store, TREND_STORE_MAX_AGE
+from src.models import warm_up, load_timings
+from src.jobs import JobManager, JobQueueFull, batch_key, normalize_company_name, unique_company_names
+from src.report_cache import ReportCache
+from src.prefetch import PrefetchScheduler
+from src.report import dumps_json
+from src.metrics import registry, request_id_var, HTTP_REQUESTS, HTTP_REQUEST_DURATION
+from fastapi.responses import FileResponse, StreamingResponse, PlainTextResponse, JSONResponse, Response
+from starlette.middleware.gzip import GZipMiddleware, DEFAULT_EXCLUDED_CONTENT_TYPES
 import os
 import json
 
 AUDIO_DIR = os.path.join(os.path.dirname(__file__), "../output")
 
+# Load spaCy / NLTK models in the background at startup instead of on import,
+# so reloads and worker spawns are fast. Set WARM_UP_MODELS=0 to load on first use.
+WARM_UP_MODELS = os.getenv("WARM_UP_MODELS", "1") == "1"
+
+def _warm_up_models():
+    try:
+        timings = warm_up()
+        logger.info(f"Models loaded: {timings}")
+        if nlp_pool.enabled:
+            nlp_pool.start()
+            logger.info(f"NLP process pool ready with {nlp_pool.workers} workers")
+    except Exception as e:
+        logger.error(f"Model warm-up failed: {str(e)}")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    if article_store is not None:
+        pruned = article_store.prune(ARTICLE_STORE_MAX_AGE)
+        logger.info(f"Pruned {pruned} articles older than {ARTICLE_STORE_MAX_AGE}s from the article store")
+    if trend_store is not None:
+        pruned = trend_store.prune(TREND_STORE_MAX_AGE)
+        logger.info(f"Pruned {pruned} points older than {TREND_STORE_MAX_AGE}s from the trend store")
+    if WARM_UP_MODELS:
+        asyncio.get_running_loop().run_in_executor(None, _warm_up_models)
+    prefetch_task = asyncio.create_task(prefetcher.run()) if prefetcher.enabled else None
+    yield
+    if prefetch_task is not None:
+        prefetch_task.cancel()
+    job_manager.shutdown()
+    nlp_pool.shutdown()
+
 # ============================
 # Initialize FastAPI App
 # ============================
-app = FastAPI()
+app = FastAPI(lifespan=lifespan)
 
 # ============================
 # Enable CORS for Frontend
@@ -25,6 +68,47 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# ============================
+# Response Compression
+# ============================
+# Large article lists are compressed for clients that accept it: Brotli when
+# the optional brotli-asgi package is installed, gzip otherwise. Streaming
+# responses are left alone so events are not held back by the compressor, and
+# so are audio downloads (already compressed, served zero-copy under a strong
+# ETag; gzip skips audio/* on its own).
+COMPRESSION_MIN_SIZE = int(os.getenv("COMPRESSION_MIN_SIZE", 1024))
+UNCOMPRESSED_PATHS = ["^/analyze/stream", "^/download/"]
+try:
+    from brotli_asgi import BrotliMiddleware
+    app.add_middleware(BrotliMiddleware, minimum_size=COMPRESSION_MIN_SIZE, excluded_handlers=UNCOMPRESSED_PATHS)
+except ImportError:
+    app.add_middleware(
+        GZipMiddleware,
+        minimum_size=COMPRESSION_MIN_SIZE,
+        exclude_content_types=DEFAULT_EXCLUDED_CONTENT_TYPES + ("application/x-ndjson",),
+    )
+
+# ============================
+# Request IDs & HTTP Metrics
+# ============================
+@app.middleware("http")
+async def request_context(request: Request, call_next):
+    """Tag each request with an id (X-Request-ID) used by span logs, and record its latency."""
+    request_id = request.headers.get("X-Request-ID") or uuid.uuid4().hex
+    token = request_id_var.set(request_id)
+    start = time.perf_counter()
+    status = 500
+    try:
+        response = await call_next(request)
+        status = response.status_code
+        response.headers["X-Request-ID"] = request_id
+        return response
+    finally:
+        route = getattr(request.scope.get("route"), "path", "unmatched")
+        HTTP_REQUEST_DURATION.observe(time.perf_counter() - start, method=request.method, route=route)
+        HTTP_REQUESTS.inc(method=request.method, route=route, status=status)
+        request_id_var.reset(token)
+
 # ============================
 # Set Up Logging
 # ============================
@@ -37,82 +121,327 @@ logger = logging.getLogger(__name__)
 class CompanyRequest(BaseModel):
     company_name: str
 
+class BatchRequest(BaseModel):
+    company_names: List[str]
+
 # ============================
 # Helper Function to Process Request
 # ============================
+class FastJSONResponse(JSONResponse):
+    """JSON response serialized in one pass by the fast encoder (orjson when installed)."""
 
-import json
-import math
+    def render(self, content) -> bytes:
+        return dumps_json(content)
+
+def audio_file_url(audio_file: str):
+    """Public download URL of a generated audio file."""
+    audio_filename = os.path.basename(audio_file)
+    return f"http://127.0.0.1:8000/download/{audio_filename}"
 
-def process_request(company_name: str):
+def build_result(report_event: dict):
+    """API result (report + audio URL) from the pipeline's in-memory report."""
+    return {
+        "report": report_event["report"].to_dict(),
+        "audio_file_url": audio_file_url(report_event["audio_path"]),
+    }
+
+def process_request(company_name: str, progress=None):
     """Run pipeline and log results."""
     try:
-        report_path, audio_file = run_pipeline(company_name)
-
-        # Read JSON data from the file
-        with open(report_path, "r", encoding="utf-8") as f:
-            report_data = json.load(f)
-
-        # Check for NaN or Infinity values
-        def validate_json(obj):
-            if isinstance(obj, dict):
-                for key, value in obj.items():
-                    obj[key] = validate_json(value)
-            elif isinstance(obj, list):
-                obj = [validate_json(item) for item in obj]
-            elif isinstance(obj, float):
-                # Handle NaN and Infinity values
-                if math.isnan(obj) or math.isinf(obj):
-                    return str(obj)  # Convert to string for JSON safety
-            return obj
-
-        # Clean data before sending as response
-        cleaned_report = validate_json(report_data)
-
-        audio_filename = audio_file.split("/")[-1]
-        audio_url = f"http://127.0.0.1:8000/download/{audio_filename}"
-
+        for event in iter_pipeline(company_name, progress=progress, stream=False):
+            if event["event"] == "report":
+                result = build_result(event["data"])
         logger.info(f"Analysis completed successfully for {company_name}")
-        return {"report": cleaned_report, "audio_file_url": audio_url}
+        return result
 
     except Exception as e:
         logger.error(f"Exception occurred: {str(e)}")
         return {"error": f"Internal server error: {str(e)}"}
 
+# ============================
+# Background Analysis Jobs
+# ============================
+# Pipelines run on a bounded worker pool so they never block the event loop.
+# Requests for the same company share the job already in flight, and once
+# ANALYSIS_WORKERS + ANALYSIS_QUEUE_LIMIT jobs are pending new ones get a 429.
+ANALYSIS_WORKERS = int(os.getenv("ANALYSIS_WORKERS", 2))
+ANALYSIS_QUEUE_LIMIT = int(os.getenv("ANALYSIS_QUEUE_LIMIT", 16))
+JOB_RESULT_TTL = int(os.getenv("JOB_RESULT_TTL", 600))
+
+# ============================
+# Report Result Cache
+# ============================
+# Finished results are cached per normalized company name (memory + disk).
+# Within REPORT_CACHE_TTL they are served as-is; after that they are still
+# served immediately (up to REPORT_CACHE_MAX_STALE) while a background job
+# refreshes them.
+REPORT_CACHE_TTL = int(os.getenv("REPORT_CACHE_TTL", 300))
+report_cache = ReportCache(
+    ttl=REPORT_CACHE_TTL,
+    max_stale=int(os.getenv("REPORT_CACHE_MAX_STALE", 86400)),
+    max_entries=int(os.getenv("REPORT_CACHE_MAX_ENTRIES", 128)),
+    max_bytes=int(os.getenv("REPORT_CACHE_MAX_BYTES", 64 * 1024 * 1024)),
+    directory=os.path.join(AUDIO_DIR, "report_cache"),
+)
+registry.register_collector("report_cache", "Report cache counter / occupancy.", lambda: report_cache.stats())
+
+def _run_analysis_job(company_name: str, progress=None):
+    result = process_request(company_name, progress=progress)
+    if "error" in result:
+        raise RuntimeError(result["error"])
+    report_cache.put(normalize_company_name(company_name), result)
+    return result
+
+job_manager = JobManager(
+    _run_analysis_job,
+    PIPELINE_STAGES,
+    max_workers=ANALYSIS_WORKERS,
+    max_queue=ANALYSIS_QUEUE_LIMIT,
+    result_ttl=JOB_RESULT_TTL,
+)
+registry.register_collector("analysis_jobs", "Analysis job queue state.", lambda: job_manager.stats())
+
+# ============================
+# Prefetching of Hot Companies
+# ============================
+# With PREFETCH_TOP_N > 0 the most requested companies (exponentially decayed
+# request counts) are re-analyzed in the background before their cached
+# report turns stale, within a concurrency cap and a pipeline-time budget.
+prefetcher = PrefetchScheduler(
+    job_manager,
+    report_cache,
+    top_n=int(os.getenv("PREFETCH_TOP_N", 0)),
+    interval=float(os.getenv("PREFETCH_INTERVAL", 60)),
+    jitter=float(os.getenv("PREFETCH_JITTER", 0.2)),
+    max_concurrent=int(os.getenv("PREFETCH_CONCURRENCY", 1)),
+    budget=float(os.getenv("PREFETCH_BUDGET", 0.25)),
+    half_life=float(os.getenv("PREFETCH_HALF_LIFE", 3600)),
+)
+
+def submit_analysis(company_name, func=None, key=None):
+    """Enqueue (or join) the analysis job for a company, mapping a full queue to 429."""
+    try:
+        return job_manager.submit(company_name, func=func, key=key)
+    except JobQueueFull as e:
+        raise HTTPException(status_code=429, detail=str(e), headers={"Retry-After": "30"})
+
+def validate_company_name(request: CompanyRequest):
+    company_name = request.company_name.strip()
+    if not company_name:
+        raise HTTPException(status_code=400, detail="Invalid company name provided.")
+    return company_name
+
 # ============================
 # API Endpoint to Analyze News
 # ============================
 @app.post("/analyze/")
 async def analyze_news(request: CompanyRequest):
-    company_name = request.company_name.strip()
+    company_name = validate_company_name(request)
+    prefetcher.record(company_name)
 
-    if not company_name:
-        raise HTTPException(status_code=400, detail="Invalid company name provided.")
+    # Serve cached results right away; refresh stale ones in the background
+    cached = report_cache.get(normalize_company_name(company_name))
+    if cached is not None:
+        result, age, is_stale = cached
+        if is_stale:
+            try:
+                job_manager.submit(company_name)
+            except JobQueueFull:
+                logger.info(f"Skipping background refresh for {company_name}: job queue is full")
+        return FastJSONResponse(
+            {"report": result["report"], "audio_file_url": result["audio_file_url"]},
+            headers={"Age": str(int(age)), "X-Cache": "STALE" if is_stale else "HIT"},
+        )
 
-    # Run the pipeline to get report and audio file path
-    result = process_request(company_name)
+    # Run the pipeline on the worker pool and wait for the report and audio file path.
+    # shield() keeps a client disconnect from cancelling a job other requests share.
+    job, _ = submit_analysis(company_name)
+    try:
+        result = await asyncio.shield(asyncio.wrap_future(job.future))
+    except Exception:
+        raise HTTPException(status_code=404, detail=job.error)
 
-    if "error" in result:
-        raise HTTPException(status_code=404, detail=result["error"])
+    return FastJSONResponse(
+        {"report": result["report"], "audio_file_url": result["audio_file_url"]},
+        headers={"Age": "0", "X-Cache": "MISS"},
+    )
+
+# ============================
+# Batch Analysis Endpoint
+# ============================
+# One run for many companies: each feed is downloaded once and each distinct
+# article analyzed once. Companies with a fresh cached report are served from
+# the cache; the others are analyzed as one job on the shared worker pool, so
+# batches count against the job queue like single analyses.
+BATCH_MAX_COMPANIES = int(os.getenv("BATCH_MAX_COMPANIES", 100))
+
+def _run_batch_job(company_names, progress=None):
+    reports = run_pipeline_many(company_names, progress=progress)
+    results = {}
+    for company_name, report_event in reports.items():
+        results[company_name] = build_result(report_event)
+        report_cache.put(normalize_company_name(company_name), results[company_name])
+    logger.info(f"Batch analysis completed successfully for {len(company_names)} companies")
+    return results
+
+def validate_batch(request: BatchRequest):
+    company_names = unique_company_names(request.company_names)
+    if not company_names:
+        raise HTTPException(status_code=400, detail="Provide at least one company name.")
+    if len(company_names) > BATCH_MAX_COMPANIES:
+        raise HTTPException(status_code=400, detail=f"At most {BATCH_MAX_COMPANIES} companies per batch.")
+    return company_names
+
+def submit_batch(company_names):
+    """Enqueue (or join) one job analyzing all of ``company_names``."""
+    return submit_analysis(company_names, func=_run_batch_job, key=batch_key(company_names))
+
+@app.post("/analyze/batch")
+async def analyze_news_batch(request: BatchRequest):
+    """Analyze several companies at once; returns one report and audio URL per company."""
+    company_names = validate_batch(request)
+
+    results = {}
+    for company_name in company_names:
+        cached = report_cache.get(normalize_company_name(company_name))
+        if cached is not None and not cached[2]:
+            result = cached[0]
+            results[company_name] = {"report": result["report"], "audio_file_url": result["audio_file_url"]}
+
+    missing = [company_name for company_name in company_names if company_name not in results]
+    if missing:
+        job, _ = submit_batch(missing)
+        try:
+            results.update(await asyncio.shield(asyncio.wrap_future(job.future)))
+        except Exception:
+            raise HTTPException(status_code=500, detail=f"Internal server error: {job.error}")
+
+    return FastJSONResponse(
+        {"results": {company_name: results[company_name] for company_name in company_names}},
+        headers={"X-Cache-Hits": str(len(company_names) - len(missing))},
+    )
+
+# ============================
+# Streaming Analysis Endpoint
+# ============================
+def stream_analysis(company_name: str, fmt: str):
+    """Serialize pipeline events as NDJSON lines or Server-Sent Events."""
+    try:
+        for event in iter_pipeline(company_name, ordered=False):
+            name, data = event["event"], event["data"]
+            if name == "audio":
+                data = {"audio_file_url": audio_file_url(data["Audio"])}
+            elif name == "report":
+                logger.info(f"Streaming analysis completed successfully for {company_name}")
+                continue
+            yield _format_event(name, data, fmt)
+        yield _format_event("done", {"company_name": company_name}, fmt)
+    except Exception as e:
+        logger.error(f"Exception occurred: {str(e)}")
+        yield _format_event("error", {"error": f"Internal server error: {str(e)}"}, fmt)
+
+def _format_event(name: str, data: dict, fmt: str):
+    if fmt == "sse":
+        return f"event: {name}\ndata: {dumps_json(data).decode('utf-8')}\n\n"
+    return dumps_json({"event": name, "data": data}).decode("utf-8") + "\n"
+
+@app.post("/analyze/stream")
+def analyze_news_stream(request: CompanyRequest, format: str = "ndjson"):
+    """Stream each article as soon as it is scored, then the comparative block and the audio URL.
+
+    ``format`` is ``ndjson`` (default) or ``sse`` (Server-Sent Events).
+    """
+    company_name = validate_company_name(request)
+    if format not in ("ndjson", "sse"):
+        raise HTTPException(status_code=400, detail="format must be 'ndjson' or 'sse'.")
+    media_type = "text/event-stream" if format == "sse" else "application/x-ndjson"
+    return StreamingResponse(stream_analysis(company_name, format), media_type=media_type)
 
-    audio_filename = result["audio_file_url"].split("/")[-1]
+@app.post("/jobs/", status_code=202)
+def create_job(request: CompanyRequest):
+    """Enqueue an analysis and return its job id without waiting for it."""
+    company_name = validate_company_name(request)
+    job, created = submit_analysis(company_name)
     return {
-        "report": result["report"], 
-        "audio_file_url": result["audio_file_url"]
-}
+        "job_id": job.id,
+        "status": job.status,
+        "joined_existing": not created,
+        "status_url": f"/jobs/{job.id}",
+    }
+
+@app.post("/jobs/batch", status_code=202)
+def create_batch_job(request: BatchRequest):
+    """Enqueue a batch analysis of every company and return its job id without waiting for it."""
+    company_names = validate_batch(request)
+    job, created = submit_batch(company_names)
+    return {
+        "job_id": job.id,
+        "status": job.status,
+        "joined_existing": not created,
+        "status_url": f"/jobs/{job.id}",
+    }
+
+@app.get("/jobs/{job_id}")
+def get_job(job_id: str):
+    """Report a job's status, per-stage progress and, once finished, its result."""
+    job = job_manager.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found.")
+    return job.to_dict()
 
 AUDIO_DIR = os.path.join(os.path.dirname(__file__), "../output")
 
+# Content-addressed audio (tts_<hash>.mp3) never changes under its name;
+# other names may be rewritten and are revalidated with their ETag
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+REVALIDATE_CACHE_CONTROL = "no-cache"
+
+def etag_matches(if_none_match, etag):
+    """Weak comparison of an If-None-Match header against a strong ETag."""
+    if if_none_match.strip() == "*":
+        return True
+    return any(tag.strip().removeprefix("W/") == etag for tag in if_none_match.split(","))
+
 @app.get("/download/{filename}")
-def download_file(filename: str):
-    """Endpoint to serve audio files dynamically."""
-    file_path = os.path.join(AUDIO_DIR, filename)
-    if os.path.exists(file_path):
-        return FileResponse(file_path, media_type="audio/mp3", filename=filename)
-    else:
+def download_file(filename: str, request: Request):
+    """Endpoint to serve audio files dynamically.
+
+    Supports byte ranges (seeking), conditional requests against a content
+    ETag (304) and long-lived caching of content-addressed files. The file
+    is sent with the server's zero-copy path where available.
+    """
+    audio_file = audio_store.lookup(filename)
+    if audio_file is None:
         raise HTTPException(status_code=404, detail="Audio file not found.")
 
+    headers = {
+        "ETag": audio_file.etag,
+        "Cache-Control": IMMUTABLE_CACHE_CONTROL if filename.startswith(audio_store.PREFIX) else REVALIDATE_CACHE_CONTROL,
+    }
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and etag_matches(if_none_match, audio_file.etag):
+        return Response(status_code=304, headers=headers)
+    return FileResponse(
+        audio_file.path,
+        media_type="audio/mpeg",
+        filename=filename,
+        headers=headers,
+        stat_result=audio_file.stat,
+    )
+
+
 
+@app.delete("/cache/{company_name}")
+def invalidate_report(company_name: str):
+    """Drop the cached report of one company."""
+    report_cache.invalidate(normalize_company_name(company_name))
+    return {"invalidated": company_name}
+
+@app.delete("/cache/")
+def invalidate_all_reports():
+    """Drop every cached report."""
+    report_cache.invalidate()
+    return {"invalidated": "all"}
 
 # ============================
 # Root Endpoint
@@ -120,3 +449,33 @@ def download_file(filename: str):
 @app.get("/")
 def read_root():
     return {"message": "News Summarization & Sentiment Analysis API is running! 🚀"}
+
+@app.get("/health/models")
+def model_health():
+    """Report which models are loaded and how long each took to load (seconds)."""
+    return {"load_timings": load_timings()}
+
+@app.get("/trend/{company_name}")
+def get_trend(company_name: str):
+    """Rolling 1h / 24h / 7d sentiment aggregates of a company's past analyses."""
+    if trend_store is None:
+        raise HTTPException(status_code=404, detail="Trend store is disabled.")
+    trend = trend_store.trend(normalize_company_name(company_name))
+    if trend is None:
+        raise HTTPException(status_code=404, detail="No trend data for this company.")
+    return trend
+
+@app.get("/health/prefetch")
+def prefetch_status():
+    """Companies kept warm by the prefetch scheduler, their cache age and the budget used."""
+    return prefetcher.status()
+
+@app.get("/health/feeds")
+def feed_health_report():
+    """Per-feed latency, error rate and circuit breaker state."""
+    return {"feeds": feed_health.stats()}
+
+@app.get("/metrics")
+def metrics():
+    """Prometheus text exposition of stage, feed, HTTP and cache metrics."""
+    return PlainTextResponse(registry.expose(), media_type="text/plain; version=0.0.4")
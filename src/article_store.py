@@ -0,0 +1,105 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+
+
+# Bump when cleaning / sentiment / NER logic changes so old rows are ignored
+ANALYSIS_VERSION = 1
+
+SCORE_COLUMNS = [
+    "title_compound", "title_pos", "title_neg", "title_neu",
+    "summary_compound", "summary_pos", "summary_neg", "summary_neu",
+]
+
+
+def article_key(link, title):
+    """Stable key of an article: hash of analysis version, link and title."""
+    payload = f"{ANALYSIS_VERSION}\n{link}\n{title}".encode("utf-8")
+    return hashlib.sha1(payload).hexdigest()
+
+
+# ============================
+# Persistent Article Store
+# ============================
+class ArticleStore:
+    """SQLite store of per-article analysis results (cleaned text, VADER scores, NER topics).
+
+    Lets the pipeline analyze only articles it has not seen before and
+    assemble the rest of the report from stored rows.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0}
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(f"""
+                CREATE TABLE IF NOT EXISTS articles (
+                    key TEXT PRIMARY KEY,
+                    cleaned_title TEXT NOT NULL,
+                    cleaned_summary TEXT NOT NULL,
+                    {", ".join(f"{column} REAL NOT NULL" for column in SCORE_COLUMNS)},
+                    topics TEXT NOT NULL,
+                    analyzed_at REAL NOT NULL
+                )
+            """)
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_articles_analyzed_at ON articles (analyzed_at)")
+
+    def get_many(self, keys):
+        """Return ``{key: row}`` for the keys that are stored; rows are dicts."""
+        keys = list(dict.fromkeys(keys))
+        columns = ["key", "cleaned_title", "cleaned_summary"] + SCORE_COLUMNS + ["topics"]
+        rows = {}
+        with self._lock:
+            # Stay well below SQLite's bound-parameter limit
+            for start in range(0, len(keys), 500):
+                chunk = keys[start:start + 500]
+                placeholders = ",".join("?" * len(chunk))
+                cursor = self._conn.execute(
+                    f"SELECT {', '.join(columns)} FROM articles WHERE key IN ({placeholders})", chunk
+                )
+                for values in cursor:
+                    row = dict(zip(columns, values))
+                    row["topics"] = json.loads(row["topics"])
+                    rows[row.pop("key")] = row
+            self._stats["hits"] += len(rows)
+            self._stats["misses"] += len(keys) - len(rows)
+        return rows
+
+    def put_many(self, rows):
+        """Insert or replace analyzed articles, given as ``{key: row}``."""
+        now = time.time()
+        columns = ["key", "cleaned_title", "cleaned_summary"] + SCORE_COLUMNS + ["topics", "analyzed_at"]
+        values = [
+            [key, row["cleaned_title"], row["cleaned_summary"]]
+            + [float(row[column]) for column in SCORE_COLUMNS]
+            + [json.dumps(row["topics"], ensure_ascii=False), now]
+            for key, row in rows.items()
+        ]
+        with self._lock, self._conn:
+            self._conn.executemany(
+                f"INSERT OR REPLACE INTO articles ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})",
+                values,
+            )
+
+    def prune(self, max_age):
+        """Delete articles analyzed more than ``max_age`` seconds ago; returns the count."""
+        with self._lock, self._conn:
+            cursor = self._conn.execute("DELETE FROM articles WHERE analyzed_at < ?", (time.time() - max_age,))
+            return cursor.rowcount
+
+    def stats(self):
+        with self._lock:
+            count = self._conn.execute("SELECT COUNT(*) FROM articles").fetchone()[0]
+            return dict(self._stats, articles=count)
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
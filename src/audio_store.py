@@ -0,0 +1,229 @@
+import hashlib
+import os
+import re
+import stat as stat_module
+import threading
+import uuid
+from dataclasses import dataclass
+
+
+# ============================
+# TTS Backends
+# ============================
+class TTSBackend:
+    """Interface for text-to-speech engines used by the audio store."""
+
+    name = "base"
+
+    def synthesize(self, text, lang, output_path):
+        """Write the spoken ``text`` as an MP3 file to ``output_path``."""
+        raise NotImplementedError
+
+
+class GTTSBackend(TTSBackend):
+    """Google Text-to-Speech (needs network access)."""
+
+    name = "gtts"
+
+    def synthesize(self, text, lang, output_path):
+        from gtts import gTTS
+
+        gTTS(text=text, lang=lang).save(output_path)
+
+
+class OfflineTTSBackend(TTSBackend):
+    """Local stand-in that writes silent MP3 frames, for tests and benchmarks."""
+
+    name = "offline"
+
+    # One silent MPEG-1 Layer III frame (128 kbps, 44.1 kHz, ~26 ms)
+    SILENT_FRAME = b"\xff\xfb\x90\x00" + b"\x00" * 413
+
+    def synthesize(self, text, lang, output_path):
+        # Roughly one frame per character so longer text gives longer audio
+        with open(output_path, "wb") as f:
+            f.write(self.SILENT_FRAME * max(1, len(text)))
+
+
+TTS_BACKENDS = {
+    GTTSBackend.name: GTTSBackend,
+    OfflineTTSBackend.name: OfflineTTSBackend,
+}
+
+
+def get_tts_backend(name):
+    """Instantiate a TTS backend by name (``gtts`` or ``offline``)."""
+    try:
+        return TTS_BACKENDS[name]()
+    except KeyError:
+        raise ValueError(f"Unknown TTS backend '{name}'. Choose one of: {', '.join(TTS_BACKENDS)}")
+
+
+# ============================
+# Servable Audio Files
+# ============================
+# Plain names only: no separators, no leading dot, so "../" can never match
+SAFE_AUDIO_NAME = re.compile(r"[A-Za-z0-9][A-Za-z0-9_.-]*\.mp3")
+
+
+@dataclass
+class AudioFile:
+    """An audio file ready to be served: its path, stat result and content ETag."""
+
+    path: str
+    stat: os.stat_result
+    etag: str = None
+
+
+def content_etag(path, chunk_size=1024 * 1024):
+    """Strong ETag from the file's bytes (SHA-256, quoted)."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return f'"{digest.hexdigest()[:32]}"'
+
+
+# ============================
+# Content-addressed Audio Store
+# ============================
+class AudioStore:
+    """Stores synthesized audio under a hash of (text, language, backend).
+
+    Identical summaries reuse the existing file instead of being synthesized
+    again. Files are written atomically (temp file + rename) and the least
+    recently used ones are evicted once the store exceeds ``max_bytes``.
+
+    The store also keeps an in-memory index of its files (stat result and
+    content ETag) so downloads of content-addressed names need no
+    filesystem lookups.
+    """
+
+    PREFIX = "tts_"
+    SUFFIX = ".mp3"
+
+    def __init__(self, directory, backend, max_bytes=200 * 1024 * 1024):
+        self.directory = directory
+        self.backend = backend
+        self.max_bytes = max_bytes
+        self._locks = {}
+        self._locks_guard = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "evictions": 0}
+        self._files = {}
+        os.makedirs(directory, exist_ok=True)
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if self._is_stored(entry.name) and entry.is_file():
+                    self._files[entry.name] = AudioFile(entry.path, entry.stat())
+
+    def key(self, text, lang):
+        payload = "\0".join([self.backend.name, lang, text]).encode("utf-8")
+        return hashlib.sha256(payload).hexdigest()[:32]
+
+    def path_for(self, key):
+        return os.path.join(self.directory, f"{self.PREFIX}{key}{self.SUFFIX}")
+
+    def get_or_create(self, text, lang):
+        """Return the path of the audio for ``text``, synthesizing it on a miss."""
+        key = self.key(text, lang)
+        path = self.path_for(key)
+        if self._touch(path):
+            self._stats["hits"] += 1
+            return path
+
+        # One synthesis per key even when concurrent requests ask for it
+        with self._lock_for(key):
+            if self._touch(path):
+                self._stats["hits"] += 1
+                return path
+            tmp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+            try:
+                self.backend.synthesize(text, lang, tmp_path)
+                os.replace(tmp_path, path)
+                self._remember(path, os.stat(path))
+            finally:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+            self._stats["misses"] += 1
+        with self._locks_guard:
+            self._locks.pop(key, None)
+
+        self.evict(keep=path)
+        return path
+
+    def evict(self, keep=None):
+        """Remove least recently used audio files until the store fits ``max_bytes``."""
+        files = []
+        for name in os.listdir(self.directory):
+            if self._is_stored(name):
+                path = os.path.join(self.directory, name)
+                try:
+                    stat = os.stat(path)
+                except FileNotFoundError:
+                    continue
+                files.append((stat.st_mtime, stat.st_size, path))
+
+        total = sum(size for _, size, _ in files)
+        for _, size, path in sorted(files):
+            if total <= self.max_bytes:
+                break
+            if path == keep:
+                continue
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            with self._locks_guard:
+                self._files.pop(os.path.basename(path), None)
+            total -= size
+            self._stats["evictions"] += 1
+
+    def lookup(self, name):
+        """Return the ``AudioFile`` to serve for a download name, or None.
+
+        Names are validated before any filesystem access. Content-addressed
+        names are answered from the index (their bytes never change); other
+        names, such as a fixed ``output_file``, may be rewritten and are
+        stat'ed, reusing the cached ETag while size and mtime are unchanged.
+        """
+        if not SAFE_AUDIO_NAME.fullmatch(name):
+            return None
+        with self._locks_guard:
+            audio_file = self._files.get(name)
+        if audio_file is None or not self._is_stored(name):
+            path = os.path.join(self.directory, name)
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                return None
+            if not stat_module.S_ISREG(stat.st_mode):
+                return None
+            if audio_file is None or (audio_file.stat.st_size, audio_file.stat.st_mtime_ns) != (stat.st_size, stat.st_mtime_ns):
+                audio_file = self._remember(path, stat)
+        if audio_file.etag is None:
+            audio_file.etag = content_etag(audio_file.path)
+        return audio_file
+
+    def stats(self):
+        return dict(self._stats, backend=self.backend.name, indexed_files=len(self._files))
+
+    def _is_stored(self, name):
+        return name.startswith(self.PREFIX) and name.endswith(self.SUFFIX)
+
+    def _remember(self, path, stat):
+        audio_file = AudioFile(path, stat)
+        with self._locks_guard:
+            self._files[os.path.basename(path)] = audio_file
+        return audio_file
+
+    def _touch(self, path):
+        """Mark a stored file as recently used; False if it does not exist."""
+        try:
+            os.utime(path)
+            return True
+        except FileNotFoundError:
+            return False
+
+    def _lock_for(self, key):
+        with self._locks_guard:
+            return self._locks.setdefault(key, threading.Lock())
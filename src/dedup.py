@@ -0,0 +1,104 @@
+import re
+import zlib
+from functools import lru_cache
+
+import numpy as np
+
+
+# Universal hashing (a * x + b) mod p over 32-bit shingle hashes; p is the
+# smallest prime above 2**32, and every intermediate value fits in uint64.
+HASH_PRIME = np.uint64(4294967311)
+MAX_HASH = np.uint64(2 ** 32 - 1)
+SHINGLE_SIZE = 2
+NUM_PERM = 128
+WORD_PATTERN = re.compile(r"[a-z0-9]+")
+
+
+def shingles(text, k=SHINGLE_SIZE):
+    """CRC32 hashes of the word k-grams of a text (one shingle for shorter texts)."""
+    words = WORD_PATTERN.findall(text.lower())
+    if len(words) <= k:
+        grams = {" ".join(words)}
+    else:
+        grams = {" ".join(words[i:i + k]) for i in range(len(words) - k + 1)}
+    return np.fromiter((zlib.crc32(gram.encode("utf-8")) for gram in grams), dtype=np.uint64, count=len(grams))
+
+
+@lru_cache(maxsize=16)
+def optimal_bands(threshold, num_perm=NUM_PERM):
+    """Pick (bands, rows) minimizing the false positive + false negative area around ``threshold``."""
+    s = np.linspace(0.0, 1.0, 201)
+    best, best_error = (1, num_perm), float("inf")
+    for bands in range(1, num_perm + 1):
+        for rows in range(1, num_perm // bands + 1):
+            probability = 1.0 - (1.0 - s ** rows) ** bands
+            false_positive = np.mean(np.where(s < threshold, probability, 0.0))
+            false_negative = np.mean(np.where(s >= threshold, 1.0 - probability, 0.0))
+            if false_positive + false_negative < best_error:
+                best, best_error = (bands, rows), false_positive + false_negative
+    return best
+
+
+# ============================
+# Near-Duplicate Index
+# ============================
+class NearDuplicateIndex:
+    """Incremental MinHash/LSH index that groups near-duplicate articles.
+
+    Each text is reduced to a MinHash signature of its word shingles and
+    bucketed by LSH bands, so a lookup only compares against the few earlier
+    texts sharing a band (sub-quadratic overall). A candidate counts as a
+    duplicate when the estimated Jaccard similarity reaches ``threshold``.
+    The first text of a cluster is its representative; later members only
+    increase its source count.
+    """
+
+    def __init__(self, threshold=0.6, num_perm=NUM_PERM, seed=1):
+        self.threshold = threshold
+        self.num_perm = num_perm
+        rng = np.random.RandomState(seed)
+        self._a = rng.randint(1, 2 ** 32, size=(num_perm, 1), dtype=np.uint64)
+        self._b = rng.randint(0, 2 ** 32, size=(num_perm, 1), dtype=np.uint64)
+        self.bands, self.rows = optimal_bands(threshold, num_perm)
+        self._buckets = [{} for _ in range(self.bands)]
+        self._signatures = {}
+        self._sources = {}
+
+    def signature(self, text):
+        hashes = shingles(text)
+        if hashes.size == 0:
+            return np.full(self.num_perm, MAX_HASH, dtype=np.uint64)
+        return ((self._a * hashes + self._b) % HASH_PRIME).min(axis=1)
+
+    def add(self, key, text, source=None):
+        """Index ``text`` under ``key``; returns the key of the cluster it joined.
+
+        That is ``key`` itself for a new cluster, or the representative's key
+        when ``text`` is a near-duplicate of an earlier article.
+        """
+        signature = self.signature(text)
+        band_keys = [
+            signature[band * self.rows:(band + 1) * self.rows].tobytes() for band in range(self.bands)
+        ]
+        for band, band_key in enumerate(band_keys):
+            for candidate in self._buckets[band].get(band_key, ()):
+                if np.count_nonzero(self._signatures[candidate] == signature) >= self.threshold * self.num_perm:
+                    self._sources[candidate].append(source)
+                    return candidate
+
+        self._signatures[key] = signature
+        self._sources[key] = [source]
+        for band, band_key in enumerate(band_keys):
+            self._buckets[band].setdefault(band_key, []).append(key)
+        return key
+
+    def add_copy(self, key, source=None):
+        """Count an exact copy (e.g. the same headline in another feed) of the cluster ``key``."""
+        self._sources[key].append(source)
+
+    def source_count(self, key):
+        """Number of articles (representative included) collapsed into a cluster."""
+        return len(self._sources.get(key, ()))
+
+    def sources(self, key):
+        return list(self._sources.get(key, ()))
@@ -0,0 +1,126 @@
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+
+
+# ============================
+# Cached Feed Entry
+# ============================
+@dataclass
+class CachedFeed:
+    entries: list
+    etag: str = None
+    last_modified: str = None
+    size: int = 0
+    expires_at: float = 0.0
+    stored_at: float = field(default_factory=time.time)
+
+    def is_fresh(self, now=None):
+        return (now or time.time()) < self.expires_at
+
+
+# ============================
+# Process-wide Feed Cache
+# ============================
+class FeedCache:
+    """Thread-safe LRU cache of parsed feeds with TTL expiry and a byte budget.
+
+    Expired entries are kept (until evicted) so their ETag / Last-Modified
+    validators can be used for a conditional GET.
+    """
+
+    def __init__(self, ttl=300, max_bytes=32 * 1024 * 1024, max_entries=256):
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self._feeds = OrderedDict()
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+        self._stats = {
+            "hits": 0,
+            "misses": 0,
+            "revalidated": 0,
+            "evictions": 0,
+            "bytes_downloaded": 0,
+            "bytes_saved": 0,
+        }
+
+    def get(self, url):
+        """Return the cached feed for ``url`` (fresh or stale) or ``None``."""
+        with self._lock:
+            cached = self._feeds.get(url)
+            if cached is not None:
+                self._feeds.move_to_end(url)
+            return cached
+
+    def get_fresh(self, url):
+        """Return cached entries if still within their TTL, counting the hit."""
+        with self._lock:
+            cached = self._feeds.get(url)
+            if cached is None or not cached.is_fresh():
+                return None
+            self._feeds.move_to_end(url)
+            self._stats["hits"] += 1
+            self._stats["bytes_saved"] += cached.size
+            return cached.entries
+
+    def put(self, url, entries, etag=None, last_modified=None, size=0, ttl=None):
+        """Store a freshly downloaded and parsed feed."""
+        ttl = self.ttl if ttl is None else ttl
+        now = time.time()
+        cached = CachedFeed(entries, etag, last_modified, size, now + ttl, now)
+        with self._lock:
+            self._stats["misses"] += 1
+            self._stats["bytes_downloaded"] += size
+            if ttl <= 0:
+                # Bypass: count the download but do not keep it around
+                self._discard(url)
+                return
+            self._discard(url)
+            self._feeds[url] = cached
+            self._total_bytes += size
+            self._evict()
+
+    def revalidate(self, url, ttl=None):
+        """Extend the lifetime of a cached feed after a 304 Not Modified."""
+        ttl = self.ttl if ttl is None else ttl
+        with self._lock:
+            cached = self._feeds.get(url)
+            if cached is None:
+                return None
+            cached.expires_at = time.time() + ttl
+            self._feeds.move_to_end(url)
+            self._stats["revalidated"] += 1
+            self._stats["bytes_saved"] += cached.size
+            return cached.entries
+
+    def invalidate(self, url=None):
+        """Drop one feed, or the whole cache when ``url`` is ``None``."""
+        with self._lock:
+            if url is None:
+                self._feeds.clear()
+                self._total_bytes = 0
+            else:
+                self._discard(url)
+
+    def stats(self):
+        """Return hit/miss counters and current occupancy."""
+        with self._lock:
+            stats = dict(self._stats)
+            stats["entries"] = len(self._feeds)
+            stats["bytes"] = self._total_bytes
+        lookups = stats["hits"] + stats["revalidated"] + stats["misses"]
+        stats["hit_ratio"] = round((stats["hits"] + stats["revalidated"]) / lookups, 4) if lookups else 0.0
+        return stats
+
+    def _discard(self, url):
+        cached = self._feeds.pop(url, None)
+        if cached is not None:
+            self._total_bytes -= cached.size
+
+    def _evict(self):
+        while self._feeds and (len(self._feeds) > self.max_entries or self._total_bytes > self.max_bytes):
+            _, cached = self._feeds.popitem(last=False)
+            self._total_bytes -= cached.size
+            self._stats["evictions"] += 1
@@ -0,0 +1,128 @@
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+
+
+# ============================
+# Per-Feed Health State
+# ============================
+@dataclass
+class FeedState:
+    latency: float = None          # EWMA of fetch latency (seconds)
+    error_rate: float = 0.0        # EWMA of failures (0..1)
+    fetches: int = 0
+    failures: int = 0
+    consecutive_failures: int = 0
+    open_until: float = 0.0        # circuit open (feed skipped) until this time
+    probe_started: float = 0.0     # when the current half-open trial fetch was allowed
+
+
+# ============================
+# Feed Health Registry
+# ============================
+class FeedHealth:
+    """Process-wide latency, error-rate and match-yield statistics per feed.
+
+    After ``failure_threshold`` consecutive failures a feed's circuit opens
+    and the feed is skipped for ``base_backoff`` seconds, doubling with every
+    further failure up to ``max_backoff``. Once the backoff has passed, one
+    request may probe the feed again (half-open); a success closes the
+    circuit. Match yield (articles matched per fetch) is tracked per
+    (feed, company) and used to fetch the most productive feeds first.
+    """
+
+    def __init__(self, failure_threshold=3, base_backoff=30.0, max_backoff=1800.0, alpha=0.3, max_companies=1024):
+        self.failure_threshold = failure_threshold
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+        self.alpha = alpha
+        self.max_companies = max_companies
+        self._feeds = {}
+        self._yields = OrderedDict()   # company -> {url: EWMA of matched articles}
+        self._lock = threading.Lock()
+
+    def _ewma(self, old, value):
+        return value if old is None else old + self.alpha * (value - old)
+
+    def allow(self, url, now=None):
+        """Whether ``url`` may be fetched now (closed circuit, or the half-open probe)."""
+        now = now or time.time()
+        with self._lock:
+            state = self._feeds.get(url)
+            if state is None or state.consecutive_failures < self.failure_threshold:
+                return True
+            # One probe at a time; a probe that never reported back (e.g. its
+            # request was cancelled) expires after base_backoff
+            if now < state.open_until or now - state.probe_started < self.base_backoff:
+                return False
+            state.probe_started = now
+            return True
+
+    def record_success(self, url, latency):
+        with self._lock:
+            state = self._feeds.setdefault(url, FeedState())
+            state.fetches += 1
+            state.latency = self._ewma(state.latency, latency)
+            state.error_rate = self._ewma(state.error_rate, 0.0)
+            state.consecutive_failures = 0
+            state.open_until = 0.0
+            state.probe_started = 0.0
+
+    def record_failure(self, url, latency=None, now=None):
+        now = now or time.time()
+        with self._lock:
+            state = self._feeds.setdefault(url, FeedState())
+            state.fetches += 1
+            state.failures += 1
+            if latency is not None:
+                state.latency = self._ewma(state.latency, latency)
+            state.error_rate = self._ewma(state.error_rate, 1.0)
+            state.consecutive_failures += 1
+            state.probe_started = 0.0
+            if state.consecutive_failures >= self.failure_threshold:
+                backoff = self.base_backoff * 2 ** (state.consecutive_failures - self.failure_threshold)
+                state.open_until = now + min(backoff, self.max_backoff)
+
+    def record_yield(self, url, company, matched):
+        with self._lock:
+            yields = self._yields.setdefault(company, {})
+            self._yields.move_to_end(company)
+            yields[url] = self._ewma(yields.get(url), matched)
+            while len(self._yields) > self.max_companies:
+                self._yields.popitem(last=False)
+
+    def prioritize(self, urls, company, max_articles):
+        """Order feeds by historical yield for ``company`` when ``max_articles`` is binding.
+
+        Known feeds come first by descending yield (list order on ties), then
+        feeds without history in list order, so repeated runs walk the same
+        productive feeds first. When the known feeds are not expected to
+        reach ``max_articles`` every feed is needed anyway and the list order
+        is kept.
+        """
+        with self._lock:
+            yields = dict(self._yields.get(company, {}))
+        if sum(yields.get(url, 0.0) for url in urls) < max_articles:
+            return list(urls)
+        return sorted(urls, key=lambda url: (url not in yields, -yields.get(url, 0.0)))
+
+    def stats(self, now=None):
+        """Snapshot of every feed's health, for the health endpoint."""
+        now = now or time.time()
+        with self._lock:
+            return {
+                url: {
+                    "latency_ms": None if state.latency is None else round(state.latency * 1000, 1),
+                    "error_rate": round(state.error_rate, 3),
+                    "fetches": state.fetches,
+                    "failures": state.failures,
+                    "consecutive_failures": state.consecutive_failures,
+                    "circuit": (
+                        "closed" if state.consecutive_failures < self.failure_threshold
+                        else "open" if now < state.open_until else "half-open"
+                    ),
+                    "retry_in": max(0.0, round(state.open_until - now, 1)),
+                }
+                for url, state in self._feeds.items()
+            }
@@ -0,0 +1,179 @@
+import contextvars
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+
+class JobQueueFull(Exception):
+    """Raised when the job queue is at capacity and new work must be rejected."""
+
+
+def normalize_company_name(company_name):
+    """Normalize a company name so equivalent requests share one job."""
+    return " ".join(company_name.split()).lower()
+
+
+def unique_company_names(company_names):
+    """Drop blank and equivalent names, keeping the first spelling of each company."""
+    unique = {}
+    for company_name in company_names:
+        if company_name.strip():
+            unique.setdefault(normalize_company_name(company_name), company_name.strip())
+    return list(unique.values())
+
+
+def batch_key(company_names):
+    """Single-flight key of a batch run: its normalized company names, in any order."""
+    return "batch:" + "|".join(sorted(normalize_company_name(name) for name in company_names))
+
+
+# ============================
+# Job State
+# ============================
+class Job:
+    """One pipeline run, with per-stage progress."""
+
+    def __init__(self, key, company_name, stages):
+        self.id = uuid.uuid4().hex
+        self.key = key
+        self.company_name = company_name
+        self.status = "queued"
+        self.stages = {stage: "pending" for stage in stages}
+        self.current_stage = None
+        self.created_at = time.time()
+        self.started_at = None
+        self.finished_at = None
+        self.result = None
+        self.error = None
+        self.future = None
+
+    @property
+    def done(self):
+        return self.status in ("succeeded", "failed")
+
+    def update_stage(self, stage):
+        """Progress callback: mark ``stage`` as running and the previous one as done."""
+        if self.current_stage is not None:
+            self.stages[self.current_stage] = "done"
+        self.current_stage = stage
+        self.stages[stage] = "running"
+
+    def to_dict(self, include_result=True):
+        completed = sum(state == "done" for state in self.stages.values())
+        data = {
+            "job_id": self.id,
+            "company_name": self.company_name,
+            "status": self.status,
+            "current_stage": self.current_stage,
+            "stages": dict(self.stages),
+            "progress": round(completed / len(self.stages), 2) if self.stages else 0.0,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+        }
+        if self.error is not None:
+            data["error"] = self.error
+        if include_result and self.status == "succeeded":
+            data["result"] = self.result
+        return data
+
+
+# ============================
+# Job Manager
+# ============================
+class JobManager:
+    """Runs pipeline jobs on a bounded worker pool.
+
+    Concurrent submissions for the same normalized company name join the job
+    already in flight (single-flight). When running plus queued jobs reach
+    ``max_workers + max_queue``, new submissions raise ``JobQueueFull``.
+    Finished jobs are kept for ``result_ttl`` seconds so clients can poll them.
+    """
+
+    def __init__(self, func, stages, max_workers=2, max_queue=16, result_ttl=600):
+        self.func = func
+        self.stages = list(stages)
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self.result_ttl = result_ttl
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="pipeline-job")
+        self._jobs = {}
+        self._in_flight = {}
+        self._lock = threading.Lock()
+
+    def submit(self, company_name, func=None, key=None):
+        """Enqueue a pipeline run, or join the one already running for this company.
+
+        ``func`` replaces the manager's function for this job (it is called
+        the same way) and ``key`` its single-flight key, which defaults to the
+        normalized company name; batch runs pass both. Returns ``(job, created)``.
+        """
+        if key is None:
+            key = normalize_company_name(company_name)
+        with self._lock:
+            self._prune()
+            job = self._in_flight.get(key)
+            if job is not None:
+                return job, False
+            if len(self._in_flight) >= self.max_workers + self.max_queue:
+                raise JobQueueFull(f"Too many analyses in progress ({len(self._in_flight)}). Try again later.")
+
+            job = Job(key, company_name, self.stages)
+            self._jobs[job.id] = job
+            self._in_flight[key] = job
+            # Run in a copy of the submitter's context so span logs keep its request id
+            job.future = self._executor.submit(contextvars.copy_context().run, self._run, job, func or self.func)
+            return job, True
+
+    def get(self, job_id):
+        with self._lock:
+            self._prune()
+            return self._jobs.get(job_id)
+
+    def stats(self):
+        with self._lock:
+            running = sum(job.status == "running" for job in self._in_flight.values())
+            return {
+                "running": running,
+                "queued": len(self._in_flight) - running,
+                "capacity": self.max_workers + self.max_queue,
+                "tracked_jobs": len(self._jobs),
+            }
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _run(self, job, func):
+        job.status = "running"
+        job.started_at = time.time()
+        try:
+            job.result = func(job.company_name, progress=job.update_stage)
+            if job.current_stage is not None:
+                job.stages[job.current_stage] = "done"
+            self._finish(job, "succeeded")
+            return job.result
+        except Exception as e:
+            if job.current_stage is not None:
+                job.stages[job.current_stage] = "failed"
+            job.error = str(e)
+            self._finish(job, "failed")
+            raise
+        finally:
+            if not job.done:
+                self._finish(job, "failed")
+
+    def _finish(self, job, status):
+        # finished_at is set with the terminal status under the lock, so
+        # _prune never sees a done job without it
+        with self._lock:
+            job.finished_at = time.time()
+            job.status = status
+            if self._in_flight.get(job.key) is job:
+                del self._in_flight[job.key]
+
+    def _prune(self):
+        cutoff = time.time() - self.result_ttl
+        expired = [job_id for job_id, job in self._jobs.items() if job.done and job.finished_at < cutoff]
+        for job_id in expired:
+            del self._jobs[job_id]
@@ -0,0 +1,191 @@
+import contextvars
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+
+# Structured span logs (one JSON line per timed span) are off by default;
+# the metrics themselves are always collected.
+TRACE_SPANS = os.getenv("TRACE_SPANS", "0") == "1"
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+request_id_var = contextvars.ContextVar("request_id", default=None)
+span_logger = logging.getLogger("src.spans")
+
+
+def _format_labels(names, values, extra=None):
+    pairs = list(zip(names, values)) + (extra or [])
+    if not pairs:
+        return ""
+    escaped = (str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") for _, value in pairs)
+    return "{" + ",".join(f'{name}="{value}"' for (name, _), value in zip(pairs, escaped)) + "}"
+
+
+# ============================
+# Metric Types
+# ============================
+class Counter:
+    """Monotonic counter with optional labels."""
+
+    type = "counter"
+
+    def __init__(self, name, documentation, labelnames=()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount=1, **labels):
+        key = tuple(labels.get(name, "") for name in self.labelnames)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def expose(self):
+        with self._lock:
+            values = dict(self._values)
+        return [f"{self.name}{_format_labels(self.labelnames, key)} {value}" for key, value in sorted(values.items())]
+
+
+class Histogram:
+    """Cumulative-bucket histogram with optional labels."""
+
+    type = "histogram"
+
+    def __init__(self, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(sorted(buckets))
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value, **labels):
+        key = tuple(labels.get(name, "") for name in self.labelnames)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                state = self._values[key] = [[0] * len(self.buckets), 0.0, 0]
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    state[0][i] += 1
+                    break
+            state[1] += value
+            state[2] += 1
+
+    def expose(self):
+        with self._lock:
+            values = {key: (list(counts), total, count) for key, (counts, total, count) in self._values.items()}
+        lines = []
+        for key, (counts, total, count) in sorted(values.items()):
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets, counts):
+                cumulative += bucket_count
+                lines.append(f"{self.name}_bucket{_format_labels(self.labelnames, key, [('le', bound)])} {cumulative}")
+            lines.append(f"{self.name}_bucket{_format_labels(self.labelnames, key, [('le', '+Inf')])} {count}")
+            lines.append(f"{self.name}_sum{_format_labels(self.labelnames, key)} {total}")
+            lines.append(f"{self.name}_count{_format_labels(self.labelnames, key)} {count}")
+        return lines
+
+
+# ============================
+# Registry & Exposition
+# ============================
+class MetricsRegistry:
+    """Holds metrics and gauge collectors and renders the Prometheus text format."""
+
+    def __init__(self):
+        self._metrics = []
+        self._collectors = []
+
+    def counter(self, name, documentation, labelnames=()):
+        metric = Counter(name, documentation, labelnames)
+        self._metrics.append(metric)
+        return metric
+
+    def histogram(self, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS):
+        metric = Histogram(name, documentation, labelnames, buckets)
+        self._metrics.append(metric)
+        return metric
+
+    def register_collector(self, prefix, documentation, func):
+        """Expose the numeric values of ``func()`` (a dict) as gauges named ``{prefix}_{key}``."""
+        self._collectors.append((prefix, documentation, func))
+
+    def expose(self):
+        lines = []
+        for metric in self._metrics:
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.type}")
+            lines.extend(metric.expose())
+        for prefix, documentation, func in self._collectors:
+            try:
+                values = func()
+            except Exception:
+                continue
+            for key, value in values.items():
+                if isinstance(value, bool) or not isinstance(value, (int, float)):
+                    continue
+                name = f"{prefix}_{key}"
+                lines.append(f"# HELP {name} {documentation}")
+                lines.append(f"# TYPE {name} gauge")
+                lines.append(f"{name} {value}")
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry()
+
+STAGE_DURATION = registry.histogram(
+    "pipeline_stage_duration_seconds", "Duration of each pipeline stage.", ["stage"]
+)
+FEED_FETCH_DURATION = registry.histogram(
+    "feed_fetch_duration_seconds", "Latency of feed downloads (including parsing).", ["feed"]
+)
+FEED_FETCH_ERRORS = registry.counter(
+    "feed_fetch_errors_total", "Failed or timed-out feed downloads.", ["feed"]
+)
+FEED_CIRCUIT_SKIPS = registry.counter(
+    "feed_circuit_open_skips_total", "Feed fetches skipped because the feed's circuit breaker is open.", ["feed"]
+)
+FEED_ARTICLES_MATCHED = registry.counter(
+    "feed_articles_matched_total", "Articles matched by the keyword filter, per feed.", ["feed"]
+)
+HTTP_REQUESTS = registry.counter(
+    "http_requests_total", "HTTP requests handled by the API.", ["method", "route", "status"]
+)
+HTTP_REQUEST_DURATION = registry.histogram(
+    "http_request_duration_seconds", "HTTP request latency.", ["method", "route"]
+)
+
+
+def feed_label(rss_url):
+    """Low-cardinality label of a feed (per-company Google News URLs share one label)."""
+    if rss_url.startswith("https://news.google.com/"):
+        return "google_news"
+    return rss_url
+
+
+# ============================
+# Spans
+# ============================
+def log_span(name, duration, **attributes):
+    """Emit a structured span log line when TRACE_SPANS is enabled."""
+    if TRACE_SPANS:
+        record = {"request_id": request_id_var.get(), "span": name, "duration_ms": round(duration * 1000, 3)}
+        record.update(attributes)
+        span_logger.info(json.dumps(record, ensure_ascii=False, default=str))
+
+
+@contextmanager
+def time_stage(stage, **attributes):
+    """Time a pipeline stage into ``pipeline_stage_duration_seconds`` (and a span log)."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        duration = time.perf_counter() - start
+        STAGE_DURATION.observe(duration, stage=stage)
+        log_span(stage, duration, **attributes)
@@ -0,0 +1,142 @@
+import os
+import threading
+import time
+
+
+# ============================
+# Paths & Config
+# ============================
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+NLTK_DATA_DIR = os.path.join(BASE_DIR, "../nltk_data")
+
+SPACY_MODEL = os.getenv("SPACY_MODEL", "en_core_web_sm")
+# Topic extraction only needs entities, so the other trained components are
+# excluded at load time.
+SPACY_EXCLUDE = ["tagger", "parser", "attribute_ruler", "lemmatizer", "senter"]
+
+# NLTK resources the pipeline needs, as (name, candidate resource paths).
+# They are resolved from the bundled nltk_data/ directory (and NLTK's usual
+# search path) and are never downloaded at runtime.
+NLTK_RESOURCES = {
+    "vader_lexicon": ["sentiment/vader_lexicon.zip"],
+    "punkt": ["tokenizers/punkt_tab/english/", "tokenizers/punkt"],
+    "stopwords": ["corpora/stopwords"],
+    "wordnet": ["corpora/wordnet", "corpora/wordnet.zip"],
+}
+
+
+# ============================
+# Lazy Model Registry
+# ============================
+_models = {}
+_load_timings = {}
+_locks = {name: threading.Lock() for name in ("nlp", "sia", "stop_words", "lemmatizer", "tokenizer")}
+
+
+def _lazy(name, loader):
+    """Load a model once (thread-safe) and remember how long it took."""
+    if name in _models:
+        return _models[name]
+    with _locks[name]:
+        if name not in _models:
+            start = time.perf_counter()
+            _models[name] = loader()
+            _load_timings[name] = round(time.perf_counter() - start, 4)
+    return _models[name]
+
+
+def _nltk():
+    import nltk
+
+    if NLTK_DATA_DIR not in nltk.data.path:
+        nltk.data.path.insert(0, NLTK_DATA_DIR)
+    return nltk
+
+
+def _require_nltk_resource(name):
+    """Make sure an NLTK resource is available locally, without downloading it."""
+    nltk = _nltk()
+    for resource_path in NLTK_RESOURCES[name]:
+        try:
+            nltk.data.find(resource_path)
+            return
+        except LookupError:
+            continue
+    raise LookupError(
+        f"NLTK resource '{name}' not found. Install it with "
+        f"`python -m nltk.downloader -d nltk_data {name}`."
+    )
+
+
+def _load_nlp():
+    import spacy
+
+    nlp = spacy.load(SPACY_MODEL, exclude=SPACY_EXCLUDE)
+    if "tok2vec" in nlp.pipe_names and "ner" not in nlp.get_pipe("tok2vec").listening_components:
+        # The small model's NER embeds its own tok2vec, so the shared one is dead weight
+        nlp.remove_pipe("tok2vec")
+    return nlp
+
+
+def _load_sia():
+    _require_nltk_resource("vader_lexicon")
+    from nltk.sentiment import SentimentIntensityAnalyzer
+
+    return SentimentIntensityAnalyzer()
+
+
+def _load_stop_words():
+    _require_nltk_resource("stopwords")
+    return set(_nltk().corpus.stopwords.words('english'))
+
+
+def _load_lemmatizer():
+    _require_nltk_resource("wordnet")
+    lemmatizer = _nltk().WordNetLemmatizer()
+    lemmatizer.lemmatize("warmup")  # WordNet itself is only read on first use
+    return lemmatizer
+
+
+def _load_tokenizer():
+    _require_nltk_resource("punkt")
+    return _nltk().word_tokenize
+
+
+def get_nlp():
+    """spaCy pipeline used for NER topic extraction."""
+    return _lazy("nlp", _load_nlp)
+
+
+def get_sentiment_analyzer():
+    """NLTK VADER sentiment analyzer."""
+    return _lazy("sia", _load_sia)
+
+
+def get_stop_words():
+    """English stopword set."""
+    return _lazy("stop_words", _load_stop_words)
+
+
+def get_lemmatizer():
+    """WordNet lemmatizer with the WordNet corpus already loaded."""
+    return _lazy("lemmatizer", _load_lemmatizer)
+
+
+def get_tokenizer():
+    """NLTK ``word_tokenize`` function backed by local Punkt data."""
+    return _lazy("tokenizer", _load_tokenizer)
+
+
+def warm_up():
+    """Load every model up front, e.g. from the app startup hook."""
+    get_nlp()
+    get_sentiment_analyzer()
+    get_stop_words()
+    get_lemmatizer()
+    get_tokenizer()
+    return load_timings()
+
+
+def load_timings():
+    """Return the load time in seconds of each model loaded so far."""
+    return dict(_load_timings)
@@ -0,0 +1,84 @@
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+from src.models import warm_up
+
+
+def _init_worker():
+    """Load spaCy and the NLTK resources once per worker process."""
+    warm_up()
+
+
+def _ready():
+    return True
+
+
+# ============================
+# Pre-warmed NLP Process Pool
+# ============================
+class NLPPool:
+    """Optional process pool for the CPU-bound clean / sentiment / NER stages.
+
+    Workers are started with the ``spawn`` method (safe next to the API's
+    threads) and load every model in their initializer, so a batch only costs
+    the pickling of its texts and results. Each worker imports the module of
+    every function it runs, so worker functions belong in modules that are
+    cheap to import (``src.analysis.analyze_chunk``). Inputs are split into
+    contiguous chunks and results come back in input order. Batches smaller
+    than ``min_batch`` run in-process, where IPC would cost more than it saves.
+    """
+
+    def __init__(self, workers=0, min_batch=64):
+        self.workers = workers
+        self.min_batch = min_batch
+        self._executor = None
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self):
+        return self.workers > 0
+
+    def start(self):
+        """Create the pool and wait until every worker has loaded its models."""
+        if not self.enabled:
+            return None
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_init_worker,
+                )
+                executor = self._executor
+                for future in [executor.submit(_ready) for _ in range(self.workers)]:
+                    future.result()
+            return self._executor
+
+    def use_for(self, n_items):
+        return self.enabled and n_items >= self.min_batch
+
+    def map_chunks(self, func, *columns):
+        """Apply ``func(*column_chunks)`` to contiguous chunks in the workers.
+
+        ``func`` must return one result per input row; the concatenated
+        results are returned in input order.
+        """
+        n = len(columns[0])
+        chunk_size = max(1, -(-n // self.workers))
+        chunks = [[column[start:start + chunk_size] for column in columns] for start in range(0, n, chunk_size)]
+        executor = self.start()
+        results = []
+        for chunk_result in executor.map(func, *zip(*chunks)):
+            results.extend(chunk_result)
+        return results
+
+    def reset(self):
+        """Drop a broken pool; the next batch starts a fresh one."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def shutdown(self):
+        self.reset()
@@ -0,0 +1,184 @@
+import asyncio
+import logging
+import random
+import threading
+import time
+from collections import deque
+
+from src.jobs import JobQueueFull, normalize_company_name
+
+logger = logging.getLogger(__name__)
+
+
+# ============================
+# Prefetch Scheduler
+# ============================
+class PrefetchScheduler:
+    """Keeps the reports of the most requested companies warm.
+
+    ``record`` counts requests per normalized company name with exponential
+    decay (``half_life`` seconds), so popularity follows recent traffic.
+    Every ``interval`` seconds (+/- ``jitter``) the ``top_n`` companies whose
+    cached report is missing or would turn stale before the next round are
+    re-analyzed through the job manager, so refreshed reports and audio land
+    in the report cache before users ask for them.
+
+    Prefetching yields to user traffic: no more than ``max_concurrent`` own
+    jobs run at once, nothing is started while user jobs are queued, and the
+    pipeline time spent on prefetching stays below ``budget`` (a fraction of
+    ``budget_window`` seconds).
+    """
+
+    def __init__(self, job_manager, report_cache, top_n=0, interval=60.0, jitter=0.2, max_concurrent=1,
+                 budget=0.25, budget_window=3600.0, half_life=3600.0, max_tracked=1024):
+        self.job_manager = job_manager
+        self.report_cache = report_cache
+        self.top_n = top_n
+        self.interval = interval
+        self.jitter = jitter
+        self.max_concurrent = max_concurrent
+        self.budget = budget
+        self.budget_window = budget_window
+        self.half_life = half_life
+        self.max_tracked = max_tracked
+        self._requests = {}            # key -> [decayed count, last update, company name]
+        self._active = {}              # key -> job started by the scheduler
+        self._spent = deque()          # (finished_at, seconds) of finished prefetch jobs
+        self._refreshed = {}           # key -> {"at", "status", "seconds", "error"}
+        self._skipped = {"budget": 0, "busy": 0, "queue_full": 0}
+        self._lock = threading.Lock()          # request counts
+        self._state_lock = threading.RLock()   # scheduling state
+
+    @property
+    def enabled(self):
+        return self.top_n > 0
+
+    def record(self, company_name, now=None):
+        """Count one request for ``company_name``."""
+        if not self.enabled:
+            return
+        now = now or time.time()
+        key = normalize_company_name(company_name)
+        with self._lock:
+            entry = self._requests.get(key)
+            if entry is None:
+                entry = self._requests[key] = [0.0, now, company_name]
+            entry[0] = self._decayed(entry, now) + 1.0
+            entry[1] = now
+            if len(self._requests) > self.max_tracked:
+                coldest = min(self._requests, key=lambda k: self._decayed(self._requests[k], now))
+                del self._requests[coldest]
+
+    def hot(self, now=None):
+        """The ``top_n`` most requested companies as ``(key, company_name, score)``, hottest first."""
+        now = now or time.time()
+        with self._lock:
+            ranked = sorted(
+                ((key, entry[2], self._decayed(entry, now)) for key, entry in self._requests.items()),
+                key=lambda item: item[2],
+                reverse=True,
+            )
+        return ranked[:self.top_n]
+
+    def tick(self, now=None):
+        """One scheduling round; returns the companies whose refresh was started."""
+        now = now or time.time()
+        with self._state_lock:
+            return self._tick(now)
+
+    def _tick(self, now):
+        self._reap(now)
+        started = []
+        # Refresh entries that would turn stale before the next round
+        refresh_age = max(0.0, self.report_cache.ttl - self.interval * (1 + self.jitter))
+        for key, company_name, _ in self.hot(now):
+            if len(self._active) >= self.max_concurrent:
+                break
+            if key in self._active:
+                continue
+            age = self.report_cache.age(key)
+            if age is not None and age < refresh_age:
+                continue
+            if self.job_manager.stats()["queued"] > 0:
+                self._skipped["busy"] += 1
+                break
+            if self._spent_seconds(now) >= self.budget * self.budget_window:
+                self._skipped["budget"] += 1
+                break
+            try:
+                job, created = self.job_manager.submit(company_name)
+            except JobQueueFull:
+                self._skipped["queue_full"] += 1
+                break
+            # A user request already running for this company refreshes it anyway
+            if created:
+                self._active[key] = job
+                started.append(company_name)
+        return started
+
+    async def run(self):
+        """Scheduling loop, started from the app lifespan."""
+        while True:
+            await asyncio.sleep(self.interval * random.uniform(1 - self.jitter, 1 + self.jitter))
+            try:
+                started = self.tick()
+                if started:
+                    logger.info(f"Prefetching reports for {', '.join(started)}")
+            except Exception as e:
+                logger.error(f"Prefetch round failed: {str(e)}")
+
+    def status(self, now=None):
+        """What is being refreshed, how stale each hot entry is, and the budget used."""
+        now = now or time.time()
+        with self._state_lock:
+            self._reap(now)
+            return self._status(now)
+
+    def _status(self, now):
+        companies = []
+        for key, company_name, score in self.hot(now):
+            age = self.report_cache.age(key)
+            companies.append({
+                "company_name": company_name,
+                "requests": round(score, 2),
+                "cache_age": None if age is None else round(age, 1),
+                "stale": age is None or age > self.report_cache.ttl,
+                "refreshing": key in self._active,
+                "last_refresh": self._refreshed.get(key),
+            })
+        return {
+            "enabled": self.enabled,
+            "top_n": self.top_n,
+            "interval": self.interval,
+            "max_concurrent": self.max_concurrent,
+            "budget_seconds": self.budget * self.budget_window,
+            "spent_seconds": round(self._spent_seconds(now), 1),
+            "skipped_rounds": dict(self._skipped),
+            "companies": companies,
+        }
+
+    def _decayed(self, entry, now):
+        return entry[0] * 0.5 ** ((now - entry[1]) / self.half_life)
+
+    def _reap(self, now):
+        """Account finished prefetch jobs and drop budget samples outside the window."""
+        for key, job in list(self._active.items()):
+            # The future completes only after the job's bookkeeping is final
+            if job.future.done():
+                del self._active[key]
+                finished_at = job.finished_at or now   # None if cancelled before it started
+                seconds = finished_at - (job.started_at or finished_at)
+                self._spent.append((finished_at, seconds))
+                self._refreshed[key] = {
+                    "at": finished_at, "status": job.status, "seconds": round(seconds, 2), "error": job.error,
+                }
+        while self._spent and self._spent[0][0] < now - self.budget_window:
+            self._spent.popleft()
+        with self._lock:
+            forgotten = [key for key in self._refreshed if key not in self._requests]
+        for key in forgotten:
+            del self._refreshed[key]
+
+    def _spent_seconds(self, now):
+        running = sum(now - job.started_at for job in self._active.values() if job.started_at is not None)
+        return sum(seconds for _, seconds in self._spent) + running
@@ -0,0 +1,66 @@
+import json
+import math
+import os
+import uuid
+from dataclasses import dataclass
+
+try:
+    import orjson
+except ImportError:  # optional: falls back to the standard library encoder
+    orjson = None
+
+
+def dumps_json(obj):
+    """Serialize to compact UTF-8 JSON bytes with orjson when installed, else ``json``."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"), allow_nan=False).encode("utf-8")
+
+
+def loads_json(data):
+    """Parse JSON text or bytes with orjson when installed, else ``json``."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def finite_or_none(value):
+    """JSON-safe float: NaN and +/-Infinity become ``None`` (null)."""
+    value = float(value)
+    return value if math.isfinite(value) else None
+
+
+# ============================
+# Typed Report
+# ============================
+@dataclass
+class Report:
+    """The comparative sentiment report of one company, built once in memory."""
+
+    company: str
+    articles: list
+    comparative_sentiment_score: dict
+    final_sentiment_analysis: str
+    audio: str
+
+    def to_dict(self):
+        """The report with its public JSON keys."""
+        return {
+            "Company": self.company,
+            "Articles": self.articles,
+            "Comparative Sentiment Score": self.comparative_sentiment_score,
+            "Final Sentiment Analysis": self.final_sentiment_analysis,
+            "Audio": self.audio,
+        }
+
+    def write(self, path):
+        """Write the serialized report atomically (temp file + rename)."""
+        tmp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(dumps_json(self.to_dict()))
+            os.replace(tmp_path, path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+        return path
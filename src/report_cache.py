@@ -0,0 +1,198 @@
+import hashlib
+import os
+import threading
+import time
+import uuid
+from collections import OrderedDict
+
+from src.report import dumps_json, loads_json
+
+
+def _remove_files(paths):
+    for path in paths:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+
+# ============================
+# Report Result Cache
+# ============================
+class ReportCache:
+    """In-memory LRU of finished analysis results, mirrored to disk.
+
+    Entries older than ``ttl`` seconds are still served (stale-while-revalidate)
+    as long as they are younger than ``max_stale``; the caller is expected to
+    refresh them in the background. Memory use is bounded both by entry count
+    and by the serialized size of the cached results; the disk mirror is held
+    to the same limits (least recently written or read files go first), and
+    entries past ``max_stale`` are deleted from both when they are next seen.
+    Files left by earlier runs are indexed at startup.
+    """
+
+    def __init__(self, ttl=300, max_stale=86400, max_entries=128, max_bytes=64 * 1024 * 1024, directory=None):
+        self.ttl = ttl
+        self.max_stale = max_stale
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.directory = directory
+        self._entries = OrderedDict()
+        self._total_bytes = 0
+        self._files = OrderedDict()   # disk path -> size, least recently used first
+        self._file_bytes = 0
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "stale_hits": 0, "misses": 0, "evictions": 0, "disk_evictions": 0}
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+            self._scan()
+
+    def get(self, key):
+        """Return ``(value, age_seconds, is_stale)`` or ``None`` on a miss."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+
+        if entry is None:
+            entry = self._load(key)
+            if entry is not None:
+                with self._lock:
+                    self._store(key, *entry)
+
+        if entry is not None:
+            value, stored_at, _ = entry
+            age = time.time() - stored_at
+            if age <= self.max_stale:
+                is_stale = age > self.ttl
+                with self._lock:
+                    self._stats["stale_hits" if is_stale else "hits"] += 1
+                return value, age, is_stale
+            # Too old to serve: drop it so it is not read again on every miss
+            self.invalidate(key)
+
+        with self._lock:
+            self._stats["misses"] += 1
+        return None
+
+    def put(self, key, value):
+        """Cache a result in memory and on disk."""
+        # Serialized once: the size accounting and the disk record share the payload
+        payload = dumps_json(value)
+        stored_at = time.time()
+        with self._lock:
+            self._store(key, value, stored_at, len(payload))
+        if self.directory:
+            path = self._path(key)
+            tmp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+            record = b'{"key":' + dumps_json(key) + b',"stored_at":' + dumps_json(stored_at) + b',"value":' + payload + b"}"
+            with open(tmp_path, "wb") as f:
+                f.write(record)
+            os.replace(tmp_path, path)
+            with self._lock:
+                evicted = self._track_file(path, len(record))
+            _remove_files(evicted)
+
+    def invalidate(self, key=None):
+        """Drop one entry, or every entry when ``key`` is ``None``."""
+        with self._lock:
+            keys = list(self._entries) if key is None else [key]
+            for k in keys:
+                self._discard(k)
+            if key is None:
+                self._files.clear()
+                self._file_bytes = 0
+            elif self.directory:
+                self._untrack_file(self._path(key))
+        if self.directory:
+            if key is None:
+                paths = [os.path.join(self.directory, name) for name in os.listdir(self.directory) if name.endswith(".json")]
+            else:
+                paths = [self._path(key)]
+            _remove_files(paths)
+
+    def age(self, key):
+        """Seconds since ``key`` was cached in memory, or ``None``."""
+        with self._lock:
+            entry = self._entries.get(key)
+            return None if entry is None else time.time() - entry[1]
+
+    def stats(self):
+        with self._lock:
+            return dict(
+                self._stats,
+                entries=len(self._entries),
+                bytes=self._total_bytes,
+                disk_entries=len(self._files),
+                disk_bytes=self._file_bytes,
+            )
+
+    def _path(self, key):
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()[:32]
+        return os.path.join(self.directory, f"{digest}.json")
+
+    def _scan(self):
+        """Index the files left by earlier runs, oldest first, and apply the limits to them."""
+        now = time.time()
+        found = []
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(".json"):
+                stat = entry.stat()
+                found.append((stat.st_mtime, entry.path, stat.st_size))
+        expired = []
+        with self._lock:
+            for mtime, path, size in sorted(found):
+                if now - mtime > self.max_stale:
+                    expired.append(path)
+                else:
+                    expired.extend(self._track_file(path, size))
+        _remove_files(expired)
+
+    def _load(self, key):
+        if not self.directory:
+            return None
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+            record = loads_json(data)
+        except (FileNotFoundError, ValueError):
+            return None
+        if record.get("key") != key:
+            return None
+        with self._lock:
+            if path in self._files:
+                self._files.move_to_end(path)
+        return record["value"], record["stored_at"], len(data)
+
+    def _track_file(self, path, size):
+        """Record a written file; returns the paths of the files evicted to stay within the limits."""
+        self._untrack_file(path)
+        self._files[path] = size
+        self._file_bytes += size
+        evicted = []
+        while self._files and (len(self._files) > self.max_entries or self._file_bytes > self.max_bytes):
+            evicted_path, evicted_size = self._files.popitem(last=False)
+            self._file_bytes -= evicted_size
+            self._stats["disk_evictions"] += 1
+            evicted.append(evicted_path)
+        return evicted
+
+    def _untrack_file(self, path):
+        size = self._files.pop(path, None)
+        if size is not None:
+            self._file_bytes -= size
+
+    def _store(self, key, value, stored_at, size):
+        self._discard(key)
+        self._entries[key] = (value, stored_at, size)
+        self._total_bytes += size
+        while self._entries and (len(self._entries) > self.max_entries or self._total_bytes > self.max_bytes):
+            _, (_, _, evicted_size) = self._entries.popitem(last=False)
+            self._total_bytes -= evicted_size
+            self._stats["evictions"] += 1
+
+    def _discard(self, key):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._total_bytes -= entry[2]
@@ -0,0 +1,121 @@
+import heapq
+from collections import Counter
+from dataclasses import dataclass, field
+from urllib.parse import urlparse
+
+
+SENTIMENT_LABELS = ("Positive", "Negative", "Neutral")
+
+
+def source_label(source):
+    """Readable name of an article source (the feed's host name)."""
+    return urlparse(source).netloc or source
+
+
+@dataclass
+class TopicEntry:
+    positions: list = field(default_factory=list)   # indices of the articles mentioning the topic
+    sentiment: Counter = field(default_factory=Counter)
+    score_sum: float = 0.0
+    scored: int = 0
+    sources: Counter = field(default_factory=Counter)
+
+
+# ============================
+# Inverted Topic Index
+# ============================
+class TopicIndex:
+    """Inverted index from topic to the articles mentioning it.
+
+    Keeps per topic the article positions, the sentiment label counts, the
+    sum of sentiment scores and the sources that covered it. Building is a
+    single pass over every article's topics (linear in the total number of
+    topics); queries only touch the index.
+    """
+
+    def __init__(self):
+        self.n_articles = 0
+        self._topics = {}
+
+    @classmethod
+    def build(cls, articles, sources=None):
+        """Index report article entries; ``sources[i]`` lists the sources of article ``i``."""
+        index = cls()
+        for i, article in enumerate(articles):
+            index.add(
+                article.get("Topics", ()),
+                article.get("Sentiment"),
+                article.get("Sentiment Score"),
+                sources[i] if sources is not None else (),
+            )
+        return index
+
+    def add(self, topics, sentiment=None, score=None, sources=()):
+        position = self.n_articles
+        self.n_articles += 1
+        labels = {source_label(source) for source in sources}
+        for topic in dict.fromkeys(topics):
+            entry = self._topics.get(topic)
+            if entry is None:
+                entry = self._topics[topic] = TopicEntry()
+            entry.positions.append(position)
+            if sentiment is not None:
+                entry.sentiment[sentiment] += 1
+            if score is not None:
+                entry.score_sum += score
+                entry.scored += 1
+            entry.sources.update(labels)
+
+    def __len__(self):
+        return len(self._topics)
+
+    def count(self, topic):
+        entry = self._topics.get(topic)
+        return len(entry.positions) if entry is not None else 0
+
+    def positions(self, topic):
+        entry = self._topics.get(topic)
+        return list(entry.positions) if entry is not None else []
+
+    def sentiment(self, topic):
+        """Sentiment split of the articles mentioning ``topic``."""
+        entry = self._topics.get(topic)
+        if entry is None:
+            return None
+        split = {label: entry.sentiment.get(label, 0) for label in SENTIMENT_LABELS}
+        split["Average Score"] = round(entry.score_sum / entry.scored, 4) if entry.scored else None
+        return split
+
+    def common(self):
+        """Topics mentioned by every article."""
+        if self.n_articles == 0:
+            return []
+        return [topic for topic, entry in self._topics.items() if len(entry.positions) == self.n_articles]
+
+    def top_shared(self, k=10, min_articles=2):
+        """The ``k`` topics mentioned by the most articles (at least ``min_articles``), first seen first on ties."""
+        shared = ((topic, entry) for topic, entry in self._topics.items() if len(entry.positions) >= min_articles)
+        return [topic for topic, _ in heapq.nlargest(k, shared, key=lambda item: len(item[1].positions))]
+
+    def unique_to_source(self):
+        """``{source: [topics]}`` for topics only one source covered (needs two or more sources)."""
+        all_sources = set()
+        for entry in self._topics.values():
+            all_sources.update(entry.sources)
+        unique = {}
+        if len(all_sources) < 2:
+            return unique
+        for topic, entry in self._topics.items():
+            if len(entry.sources) == 1:
+                unique.setdefault(next(iter(entry.sources)), []).append(topic)
+        return unique
+
+    def summary(self, topic):
+        """Report entry of one topic: article and source counts plus its sentiment split."""
+        entry = self._topics[topic]
+        return {
+            "Topic": topic,
+            "Articles": len(entry.positions),
+            "Sources": len(entry.sources),
+            "Sentiment": self.sentiment(topic),
+        }
@@ -0,0 +1,206 @@
+import os
+import sqlite3
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+
+BUCKET_SECONDS = 300
+# Rolling windows (label -> seconds), each a whole number of buckets
+WINDOWS = {"1h": 3600, "24h": 24 * 3600, "7d": 7 * 24 * 3600}
+LABELS = ("Positive", "Negative", "Neutral")
+
+
+def parse_published(published):
+    """Unix time of an RSS ``published`` string (RFC 822 or ISO 8601); None if unparsable."""
+    if not isinstance(published, str) or not published.strip():
+        return None
+    for parse in (parsedate_to_datetime, datetime.fromisoformat):
+        try:
+            parsed = parse(published.strip())
+        except (TypeError, ValueError, IndexError):
+            continue
+        if parsed.tzinfo is None:
+            parsed = parsed.replace(tzinfo=timezone.utc)
+        return parsed.timestamp()
+    return None
+
+
+def bucket_of(timestamp):
+    return int(timestamp // BUCKET_SECONDS) * BUCKET_SECONDS
+
+
+# ============================
+# Sentiment Time Series
+# ============================
+class TrendStore:
+    """SQLite time series of article sentiment per company.
+
+    Each article is recorded once (``INSERT OR IGNORE`` on its key) and added
+    to a 5-minute bucket with label counts and the sum of compound scores.
+    Rolling 1h / 24h / 7d aggregates are kept as running sums: new points
+    are added to every window covering their bucket, and when a window
+    slides only the buckets that fell out of it are subtracted. Reading a
+    trend therefore touches a few rows, however many articles are stored.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        counters = ", ".join(f"{label.lower()} INTEGER NOT NULL DEFAULT 0" for label in LABELS)
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS points (
+                    company TEXT NOT NULL,
+                    key TEXT NOT NULL,
+                    published REAL NOT NULL,
+                    compound REAL,
+                    label TEXT NOT NULL,
+                    PRIMARY KEY (company, key)
+                )
+            """)
+            self._conn.execute(f"""
+                CREATE TABLE IF NOT EXISTS buckets (
+                    company TEXT NOT NULL,
+                    bucket INTEGER NOT NULL,
+                    {counters},
+                    compound_sum REAL NOT NULL DEFAULT 0,
+                    scored INTEGER NOT NULL DEFAULT 0,
+                    PRIMARY KEY (company, bucket)
+                )
+            """)
+            self._conn.execute(f"""
+                CREATE TABLE IF NOT EXISTS windows (
+                    company TEXT NOT NULL,
+                    seconds INTEGER NOT NULL,
+                    start INTEGER NOT NULL,
+                    {counters},
+                    compound_sum REAL NOT NULL DEFAULT 0,
+                    scored INTEGER NOT NULL DEFAULT 0,
+                    PRIMARY KEY (company, seconds)
+                )
+            """)
+
+    def add(self, company, points, now=None):
+        """Record ``(key, published, compound, label)`` points; returns how many were new.
+
+        ``published`` is a Unix time (None or a future time counts as ``now``);
+        ``compound`` may be None when the score is not finite.
+        """
+        now = now or time.time()
+        added = 0
+        with self._lock, self._conn:
+            self._advance(company, now)
+            for key, published, compound, label in points:
+                if label not in LABELS:
+                    continue
+                timestamp = now if published is None else min(published, now)
+                cursor = self._conn.execute(
+                    "INSERT OR IGNORE INTO points (company, key, published, compound, label) VALUES (?, ?, ?, ?, ?)",
+                    (company, key, timestamp, compound, label),
+                )
+                if cursor.rowcount == 0:
+                    continue
+                added += 1
+                delta = {label.lower(): 0 for label in LABELS}
+                delta[label.lower()] = 1
+                values = (*delta.values(), compound or 0.0, int(compound is not None))
+                columns = [*delta, "compound_sum", "scored"]
+                self._conn.execute(
+                    f"INSERT INTO buckets (company, bucket, {', '.join(columns)}) VALUES (?, ?, ?, ?, ?, ?, ?) "
+                    f"ON CONFLICT (company, bucket) DO UPDATE SET "
+                    + ", ".join(f"{column} = {column} + excluded.{column}" for column in columns),
+                    (company, bucket_of(timestamp), *values),
+                )
+                self._conn.execute(
+                    f"UPDATE windows SET {', '.join(f'{column} = {column} + ?' for column in columns)} "
+                    "WHERE company = ? AND start <= ?",
+                    (*values, company, bucket_of(timestamp)),
+                )
+        return added
+
+    def trend(self, company, now=None):
+        """Rolling aggregates per window, or None for a company never recorded."""
+        now = now or time.time()
+        with self._lock, self._conn:
+            known = self._conn.execute(
+                "SELECT 1 FROM windows WHERE company = ? UNION ALL SELECT 1 FROM buckets WHERE company = ? LIMIT 1",
+                (company, company),
+            ).fetchone()
+            if known is None:
+                return None
+            self._advance(company, now)
+            rows = self._conn.execute(
+                f"SELECT seconds, {', '.join(label.lower() for label in LABELS)}, compound_sum, scored "
+                "FROM windows WHERE company = ?",
+                (company,),
+            ).fetchall()
+        windows = {}
+        by_seconds = {row[0]: row[1:] for row in rows}
+        for name, seconds in WINDOWS.items():
+            *counts, compound_sum, scored = by_seconds[seconds]
+            windows[name] = {
+                "articles": sum(counts),
+                "sentiment": dict(zip(LABELS, counts)),
+                "mean_compound": round(compound_sum / scored, 4) if scored else None,
+            }
+        return {"company": company, "as_of": now, "windows": windows}
+
+    def prune(self, max_age, now=None):
+        """Delete points and buckets older than ``max_age`` seconds; returns the points deleted.
+
+        Every company's windows are slid to ``now`` first, so the buckets they
+        still count are subtracted before those buckets are deleted.
+        """
+        now = now or time.time()
+        cutoff = now - max(max_age, max(WINDOWS.values()))
+        with self._lock, self._conn:
+            for (company,) in self._conn.execute("SELECT DISTINCT company FROM windows").fetchall():
+                self._advance(company, now)
+            self._conn.execute("DELETE FROM buckets WHERE bucket < ?", (bucket_of(cutoff),))
+            return self._conn.execute("DELETE FROM points WHERE published < ?", (bucket_of(cutoff),)).rowcount
+
+    def stats(self):
+        with self._lock:
+            points = self._conn.execute("SELECT COUNT(*) FROM points").fetchone()[0]
+            buckets = self._conn.execute("SELECT COUNT(*) FROM buckets").fetchone()[0]
+            return {"points": points, "buckets": buckets}
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def _advance(self, company, now):
+        """Slide the company's windows to ``now``, subtracting buckets that left them."""
+        current = bucket_of(now)
+        sums = f"{', '.join(f'COALESCE(SUM({label.lower()}), 0)' for label in LABELS)}, " \
+               "COALESCE(SUM(compound_sum), 0), COALESCE(SUM(scored), 0)"
+        columns = [*(label.lower() for label in LABELS), "compound_sum", "scored"]
+        for seconds in WINDOWS.values():
+            start = current - seconds + BUCKET_SECONDS
+            row = self._conn.execute(
+                "SELECT start FROM windows WHERE company = ? AND seconds = ?", (company, seconds)
+            ).fetchone()
+            if row is None:
+                values = self._conn.execute(
+                    f"SELECT {sums} FROM buckets WHERE company = ? AND bucket >= ?", (company, start)
+                ).fetchone()
+                self._conn.execute(
+                    f"INSERT INTO windows (company, seconds, start, {', '.join(columns)}) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    (company, seconds, start, *values),
+                )
+            elif row[0] < start:
+                expired = self._conn.execute(
+                    f"SELECT {sums} FROM buckets WHERE company = ? AND bucket >= ? AND bucket < ?",
+                    (company, row[0], start),
+                ).fetchone()
+                self._conn.execute(
+                    f"UPDATE windows SET start = ?, {', '.join(f'{column} = {column} - ?' for column in columns)} "
+                    "WHERE company = ? AND seconds = ?",
+                    (start, *expired, company, seconds),
+                )
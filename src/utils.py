@@ -6,11 +6,35 @@ import json
 import requests
 import pandas as pd
 import re
-import nltk
-import spacy
-from bs4 import BeautifulSoup
-from gtts import gTTS
-from nltk.sentiment import SentimentIntensityAnalyzer
+import threading
+import uuid
+import time
+import contextvars
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from requests.adapters import HTTPAdapter
+from src.feed_cache import FeedCache
+from src.feed_health import FeedHealth
+from src.jobs import normalize_company_name, unique_company_names
+from src import analysis
+# The text analysis stages live in src.analysis (importable by NLP pool workers)
+from src.analysis import (
+    NER_LABELS, NER_BATCH_SIZE, NER_N_PROCESS, SENTIMENT_THRESHOLD, SENTIMENT_FIELDS,
+    strip_html, lemmatize_token, clean_and_preprocess, clean_and_preprocess_batch,
+    score_sentiment_batch, sentiment_labels, count_sentiments, get_sentiment,
+    extract_topics_ner, extract_topics_batch,
+)
+from src.audio_store import AudioStore, get_tts_backend
+from src.article_store import ArticleStore, article_key
+from src.nlp_pool import NLPPool
+from src.dedup import NearDuplicateIndex
+from src.report import Report, finite_or_none
+from src.topic_index import TopicIndex
+from src.trend_store import TrendStore, parse_published
+from src.metrics import (
+    registry, time_stage, log_span, feed_label,
+    STAGE_DURATION, FEED_FETCH_DURATION, FEED_FETCH_ERRORS, FEED_ARTICLES_MATCHED, FEED_CIRCUIT_SKIPS,
+)
 
 
 #Global Paths & Config
@@ -22,15 +46,6 @@ OUTPUT_DIR = os.path.join(BASE_DIR, "../output")
 os.makedirs(DATA_DIR, exist_ok=True)
 os.makedirs(OUTPUT_DIR, exist_ok=True)
 
-# Load spaCy NER model
-nlp = spacy.load("en_core_web_sm")
-
-# Initialize NLTK VADER Sentiment Analyzer
-nltk.download('vader_lexicon')
-nltk.download('punkt')
-nltk.download('stopwords')
-nltk.download('wordnet')
-sia = SentimentIntensityAnalyzer()
 
 
 # ============================
@@ -68,10 +83,69 @@ def generate_search_keywords(company_name):
     
     return search_keywords
 
-def extract_news(company_name, max_articles=30):
-    """Extract news articles related to the company."""
-    rss_feeds = [
-        "https://rss.nytimes.com/services/xml/rss/nyt/Business.xml",
+def _is_word_char(char):
+    """Mirror the regex definition of a word character (\\w)."""
+    return char.isalnum() or char == "_"
+
+class KeywordMatcher:
+    """Match the keywords of many companies against a text in a single scan.
+
+    All keywords are compiled into one zero-width alternation (longest first),
+    so each position of the text is tested once. Shorter keywords that are
+    word-bounded prefixes of a longer match are implied by it, which keeps the
+    result identical to testing every ``\\bkeyword\\b`` pattern separately.
+    """
+
+    def __init__(self, keyword_sets):
+        self._owners = {}
+        for company, keywords in keyword_sets.items():
+            for keyword in keywords:
+                keyword = keyword.lower()
+                if not keyword:
+                    continue
+                owners = self._owners.setdefault(keyword, [])
+                if company not in owners:
+                    owners.append(company)
+
+        keywords = sorted(self._owners, key=len, reverse=True)
+        self._implied = {
+            keyword: [
+                other for other in keywords
+                if keyword.startswith(other) and (
+                    len(other) == len(keyword)
+                    or _is_word_char(keyword[len(other) - 1]) != _is_word_char(keyword[len(other)])
+                )
+            ]
+            for keyword in keywords
+        }
+        alternation = "|".join(re.escape(keyword) for keyword in keywords)
+        self._pattern = re.compile(rf"(?=\b({alternation})\b)") if keywords else None
+
+    @property
+    def companies(self):
+        return sorted({company for owners in self._owners.values() for company in owners})
+
+    def match(self, *texts):
+        """Return ``{company: set(matched keywords)}`` for the given texts."""
+        matched = {}
+        if self._pattern is None:
+            return matched
+        text = "\n".join(t for t in texts if isinstance(t, str)).lower()
+        for keyword in {m.group(1) for m in self._pattern.finditer(text)}:
+            for implied in self._implied[keyword]:
+                for company in self._owners[implied]:
+                    matched.setdefault(company, set()).add(implied)
+        return matched
+
+def build_keyword_matcher(company_names):
+    """Build one matcher covering the search keywords of every given company."""
+    return KeywordMatcher({name: generate_search_keywords(name) for name in company_names})
+
+# ============================
+#  RSS Feeds & Concurrent Fetching
+# ============================
+RSS_FEEDS = [
+    "https://rss.nytimes.com/services/xml/rss/nyt/Business.xml",
     "https://feeds.bbci.co.uk/news/business/rss.xml",
     "https://www.theverge.com/rss/index.xml",
     "https://feeds.marketwatch.com/marketwatch/topstories/",
@@ -92,141 +166,495 @@ def extract_news(company_name, max_articles=30):
     "https://www.saastr.com/feed/",
     "https://www.artificialintelligence-news.com/feed/",
     "https://openai.com/feed/"
-        ]
-    
-    google_news_url = f"https://news.google.com/rss/search?q={company_name.replace(' ', '+')}&hl=en-US&gl=US&ceid=US:en"
-    rss_feeds.append(google_news_url)
+]
 
-    search_keywords = generate_search_keywords(company_name)
-    keyword_patterns = [re.compile(rf'\b{re.escape(keyword.lower())}\b') for keyword in search_keywords]
+FEED_TIMEOUT = float(os.getenv("FEED_TIMEOUT", 5))         # seconds per feed (connect / read)
+FETCH_DEADLINE = float(os.getenv("FETCH_DEADLINE", 15))    # seconds for the whole fetch stage
+FETCH_WORKERS = int(os.getenv("FETCH_WORKERS", 8))
+FEED_USER_AGENT = "Mozilla/5.0 (compatible; NewsSummarizer/1.0)"
 
-    articles = []
-    seen_titles = set()
+_http_session = None
+_http_session_lock = threading.Lock()
 
-    for rss_url in rss_feeds:
-        if len(articles) >= max_articles:
-            break
-        try:
-            feed = feedparser.parse(rss_url)
-            for entry in feed.entries:
-                title = entry.get('title', '').strip()
-                if title in seen_titles or len(articles) >= max_articles:
+def get_http_session():
+    """Return the process-wide keep-alive session shared by all feed fetches."""
+    global _http_session
+    if _http_session is None:
+        with _http_session_lock:
+            if _http_session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=FETCH_WORKERS * 2, pool_maxsize=FETCH_WORKERS)
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                session.headers.update({"User-Agent": FEED_USER_AGENT})
+                _http_session = session
+    return _http_session
+
+# Process-wide cache of parsed feeds. The per-company Google News search
+# changes quickly and is not shared between companies, so it gets its own TTL
+# (set GOOGLE_NEWS_CACHE_TTL=0 to bypass the cache for it entirely).
+FEED_CACHE_TTL = float(os.getenv("FEED_CACHE_TTL", 300))
+GOOGLE_NEWS_CACHE_TTL = float(os.getenv("GOOGLE_NEWS_CACHE_TTL", 60))
+feed_cache = FeedCache(
+    ttl=FEED_CACHE_TTL,
+    max_bytes=int(os.getenv("FEED_CACHE_MAX_BYTES", 32 * 1024 * 1024)),
+    max_entries=int(os.getenv("FEED_CACHE_MAX_ENTRIES", 256)),
+)
+registry.register_collector("feed_cache", "Feed cache counter / occupancy.", lambda: feed_cache.stats())
+
+# Feeds failing FEED_FAILURE_THRESHOLD times in a row are skipped for
+# FEED_BACKOFF seconds, doubling per further failure up to FEED_MAX_BACKOFF
+# (their last cached copy is used meanwhile, if any).
+feed_health = FeedHealth(
+    failure_threshold=int(os.getenv("FEED_FAILURE_THRESHOLD", 3)),
+    base_backoff=float(os.getenv("FEED_BACKOFF", 30)),
+    max_backoff=float(os.getenv("FEED_MAX_BACKOFF", 1800)),
+)
+
+def feed_cache_ttl(rss_url):
+    """Return the cache TTL (seconds) for a feed URL."""
+    if rss_url.startswith("https://news.google.com/"):
+        return GOOGLE_NEWS_CACHE_TTL
+    return FEED_CACHE_TTL
+
+def fetch_feed(rss_url, timeout=FEED_TIMEOUT, etag=None, last_modified=None):
+    """Download a single feed, conditionally when validators are given.
+
+    Returns ``(content, etag, last_modified)``; ``content`` is ``None`` when
+    the server answered 304 Not Modified.
+    """
+    headers = {}
+    if etag:
+        headers["If-None-Match"] = etag
+    if last_modified:
+        headers["If-Modified-Since"] = last_modified
+
+    response = get_http_session().get(rss_url, headers=headers, timeout=timeout)
+    if response.status_code == 304:
+        return None, etag, last_modified
+    response.raise_for_status()
+    return response.content, response.headers.get("ETag"), response.headers.get("Last-Modified")
+
+def parse_feed_entries(content):
+    """Parse raw feed bytes into plain entry dicts with the fields we use."""
+    feed = feedparser.parse(content)
+    return [
+        {
+            'title': entry.get('title', ''),
+            'summary': entry.get('summary', ''),
+            'link': entry.get('link', ''),
+            'published': entry.get('published', ''),
+        }
+        for entry in feed.entries
+    ]
+
+def load_feed(rss_url, timeout=FEED_TIMEOUT):
+    """Return the parsed entries of a feed, revalidating the cached copy if any."""
+    start = time.perf_counter()
+    try:
+        entries = _load_feed(rss_url, timeout)
+        feed_health.record_success(rss_url, time.perf_counter() - start)
+        return entries
+    except Exception:
+        feed_health.record_failure(rss_url, time.perf_counter() - start)
+        raise
+    finally:
+        duration = time.perf_counter() - start
+        FEED_FETCH_DURATION.observe(duration, feed=feed_label(rss_url))
+        log_span("fetch_feed", duration, feed=rss_url)
+
+def _load_feed(rss_url, timeout):
+    ttl = feed_cache_ttl(rss_url)
+    cached = feed_cache.get(rss_url) if ttl > 0 else None
+    etag, last_modified = (cached.etag, cached.last_modified) if cached else (None, None)
+
+    content, etag, last_modified = fetch_feed(rss_url, timeout, etag, last_modified)
+    if content is None:
+        entries = feed_cache.revalidate(rss_url, ttl)
+        if entries is not None:
+            return entries
+        # Evicted between lookup and response: fetch unconditionally
+        content, etag, last_modified = fetch_feed(rss_url, timeout)
+
+    entries = parse_feed_entries(content)
+    feed_cache.put(rss_url, entries, etag, last_modified, size=len(content), ttl=ttl)
+    return entries
+
+def iter_feed_entries(rss_urls, timeout=FEED_TIMEOUT, deadline=FETCH_DEADLINE, max_workers=FETCH_WORKERS):
+    """Load feeds concurrently and yield (url, entries) pairs as each one completes.
+
+    Fresh cache hits are yielded first without touching the network. Feeds
+    whose circuit breaker is open are not fetched: their stale cached entries
+    are yielded if there are any, ``None`` otherwise. Failed feeds yield
+    ``None`` as their entries. Feeds are submitted in the given order, so put
+    the most important ones first.
+
+    The overall deadline runs from submission and only applies to downloads:
+    feeds that finished in time are yielded however long the caller takes
+    to consume each one, and only feeds still downloading when it expires
+    are abandoned and not yielded at all.
+    """
+    immediate = []
+    to_fetch = []
+    for rss_url in rss_urls:
+        entries = feed_cache.get_fresh(rss_url) if feed_cache_ttl(rss_url) > 0 else None
+        if entries is not None:
+            immediate.append((rss_url, entries))
+        elif feed_health.allow(rss_url):
+            to_fetch.append(rss_url)
+        else:
+            FEED_CIRCUIT_SKIPS.inc(feed=feed_label(rss_url))
+            cached = feed_cache.get(rss_url)
+            immediate.append((rss_url, cached.entries if cached is not None else None))
+    if not to_fetch:
+        yield from immediate
+        return
+
+    executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="feed-fetch")
+    # Each fetch runs in a copy of the caller's context so span logs keep the request id
+    futures = {executor.submit(contextvars.copy_context().run, load_feed, url, timeout): url for url in to_fetch}
+    expires = time.monotonic() + deadline
+    try:
+        yield from immediate
+        pending = set(futures)
+        while pending:
+            done, pending = wait(pending, timeout=max(0.0, expires - time.monotonic()), return_when=FIRST_COMPLETED)
+            if not done:
+                for url in (futures[future] for future in pending):
+                    FEED_FETCH_ERRORS.inc(feed=feed_label(url))
+                print(f"⚠️ Fetch deadline of {deadline}s reached. Skipping {len(pending)} slow feed(s).")
+                break
+            for future in (future for future in futures if future in done):
+                rss_url = futures[future]
+                try:
+                    yield rss_url, future.result()
+                except Exception as e:
+                    print(f"⚠️ Error fetching feed {rss_url}: {e}. Skipping...")
+                    FEED_FETCH_ERRORS.inc(feed=feed_label(rss_url))
+                    yield rss_url, None
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+def load_feeds(rss_urls, timeout=FEED_TIMEOUT, deadline=FETCH_DEADLINE, max_workers=FETCH_WORKERS):
+    """Load all feeds concurrently and return a dict of url -> entries (or None)."""
+    return dict(iter_feed_entries(rss_urls, timeout=timeout, deadline=deadline, max_workers=max_workers))
+
+def google_news_feed_url(company_name):
+    """Build the company-specific Google News RSS search URL."""
+    return f"https://news.google.com/rss/search?q={company_name.replace(' ', '+')}&hl=en-US&gl=US&ceid=US:en"
+
+ARTICLE_COLUMNS = ['Title', 'Summary', 'Link', 'Published', 'Source']
+
+# Syndicated stories re-published with slightly different headlines are
+# collapsed to their first copy (MinHash/LSH over title + summary) before
+# analysis; the report records how many sources carried each story.
+# NEAR_DUPLICATE_THRESHOLD=0 turns this off (exact-title de-duplication only).
+NEAR_DUPLICATE_THRESHOLD = float(os.getenv("NEAR_DUPLICATE_THRESHOLD", 0.6))
+
+def new_duplicate_index():
+    """Return a fresh near-duplicate index, or ``None`` when detection is disabled."""
+    return NearDuplicateIndex(NEAR_DUPLICATE_THRESHOLD) if NEAR_DUPLICATE_THRESHOLD > 0 else None
+
+def _is_near_duplicate(duplicates, title, summary, link, rss_url):
+    """Index an article; True if it belongs to a story already selected."""
+    if duplicates is None:
+        return False
+    key = article_key(link, title)
+    return duplicates.add(key, f"{title}\n{summary}", rss_url) != key
+
+def _count_repeat(duplicates, seen_titles, title, rss_url):
+    """Count an exact-title repeat of a selected article as another copy of its story."""
+    if duplicates is not None:
+        duplicates.add_copy(seen_titles[title], rss_url)
+
+def with_source_counts(articles_data, keys, duplicates):
+    """Set the "Source Count" of each article entry (1 without near-duplicate detection)."""
+    for article_info, key in zip(articles_data, keys):
+        article_info["Source Count"] = duplicates.source_count(key) if duplicates is not None else 1
+    return articles_data
+
+def _iter_in_list_order(feed_iter, rss_urls):
+    """Re-order (url, entries) pairs from completion order into list order.
+
+    Each feed is released as soon as every feed before it has arrived, so
+    output starts before the slowest feed finishes. Feeds abandoned at the
+    fetch deadline never arrive and are skipped.
+    """
+    arrived = {}
+    next_index = 0
+    try:
+        for rss_url, entries in feed_iter:
+            arrived[rss_url] = entries
+            while next_index < len(rss_urls) and rss_urls[next_index] in arrived:
+                ready_url = rss_urls[next_index]
+                next_index += 1
+                yield ready_url, arrived.pop(ready_url)
+        for ready_url in rss_urls[next_index:]:
+            if ready_url in arrived:
+                yield ready_url, arrived.pop(ready_url)
+    finally:
+        feed_iter.close()
+
+def _match_entries(entries, rss_url, keyword_matcher, seen_titles, limit, duplicates=None):
+    """Return up to ``limit`` new articles from one feed that match the keywords, as columns.
+
+    Near-duplicates of articles already selected (per ``duplicates``) and
+    exact-title repeats are skipped; both are counted as copies of the
+    selected article. ``seen_titles`` maps the selected titles to their keys.
+    """
+    columns = {column: [] for column in ARTICLE_COLUMNS}
+    matched = 0
+    try:
+        for entry in entries:
+            title = entry.get('title', '').strip()
+            if matched >= limit:
+                continue
+            if title in seen_titles:
+                _count_repeat(duplicates, seen_titles, title, rss_url)
+                continue
+            
+            summary = entry.get('summary', '').strip()
+            link = entry.get('link', '').strip()
+            published = entry.get('published', '').strip()
+
+            summary_cleaned = strip_html(summary)
+            if keyword_matcher.match(title, summary_cleaned):
+                if _is_near_duplicate(duplicates, title, summary_cleaned, link, rss_url):
                     continue
-                
-                summary = entry.get('summary', '').strip()
-                link = entry.get('link', '').strip()
-                published = entry.get('published', '').strip()
-
-                summary_cleaned = BeautifulSoup(summary, "html.parser").get_text()
-                if any(pattern.search(title.lower()) for pattern in keyword_patterns) or \
-                   any(pattern.search(summary_cleaned.lower()) for pattern in keyword_patterns):
-                    articles.append({
-                        'Title': title,
-                        'Summary': summary_cleaned,
-                        'Link': link,
-                        'Published': published,
-                        'Source': rss_url
-                    })
-                    seen_titles.add(title)
+                columns['Title'].append(title)
+                columns['Summary'].append(summary_cleaned)
+                columns['Link'].append(link)
+                columns['Published'].append(published)
+                columns['Source'].append(rss_url)
+                seen_titles[title] = article_key(link, title)
+                matched += 1
 
-        except Exception as e:
-            print(f"⚠️ Error parsing feed {rss_url}. Skipping...")
+    except Exception as e:
+        print(f"⚠️ Error parsing feed {rss_url}. Skipping...")
+    return columns, matched
 
-    csv_file_path = os.path.join(DATA_DIR, f"{company_name}_news.csv")
-    if articles:
-        pd.DataFrame(articles).to_csv(csv_file_path, index=False)
-        print(f"✅ Successfully saved {len(articles)} articles in '{csv_file_path}'.")
-    else:
+def iter_news(company_name, max_articles=30, rss_feeds=None, ordered=True, duplicates=None):
+    """Yield news articles related to the company, one DataFrame batch per feed.
+
+    With ``ordered=True`` feeds are walked in list order, so the max_articles
+    cut-off and title de-duplication are deterministic. When the company's
+    feed history says max_articles will be reached, the list is first
+    re-ordered by historical match yield (``FeedHealth.prioritize``), so the
+    limit is hit with fewer fetches. With ``ordered=False``
+    feeds are used in the order they finish downloading, which gets the first
+    articles out sooner. Feeds not yet downloaded when the limit is reached
+    are cancelled.
+
+    ``rss_feeds`` overrides the default feed list (static feeds plus the
+    company's Google News search), e.g. to point at a local fixture server.
+    ``duplicates`` is the near-duplicate index to use (a fresh one by
+    default); pass your own to read the source counts afterwards.
+    """
+    if duplicates is None:
+        duplicates = new_duplicate_index()
+    if rss_feeds is None:
+        rss_feeds = RSS_FEEDS + [google_news_feed_url(company_name)]
+    company_key = normalize_company_name(company_name)
+    rss_feeds = feed_health.prioritize(list(dict.fromkeys(rss_feeds)), company_key, max_articles)
+
+    keyword_matcher = build_keyword_matcher([company_name])
+    seen_titles = {}
+    article_count = 0
+
+    # Feeds load in parallel (from the cache where possible)
+    feeds = iter_feed_entries(rss_feeds)
+    if ordered:
+        feeds = _iter_in_list_order(feeds, rss_feeds)
+    try:
+        for rss_url, entries in feeds:
+            if entries is None:
+                # Failures are tracked by the circuit breaker, not as a zero match yield
+                continue
+            columns, matched = _match_entries(entries, rss_url, keyword_matcher, seen_titles, max_articles - article_count,
+                                              duplicates)
+            article_count += matched
+            FEED_ARTICLES_MATCHED.inc(matched, feed=feed_label(rss_url))
+            feed_health.record_yield(rss_url, company_key, matched)
+            if matched:
+                yield pd.DataFrame(columns, columns=ARTICLE_COLUMNS)
+            if article_count >= max_articles:
+                break
+    finally:
+        feeds.close()
+
+# Extracted articles are persisted off the request path by a single background
+# writer. ARTICLES_SINK_FORMAT selects csv (data/{company}_news.csv, the
+# historical format), parquet (compact and fast to reload) or none.
+ARTICLES_SINK_FORMAT = os.getenv("ARTICLES_SINK_FORMAT", "csv")
+ARTICLE_SINK_EXTENSIONS = {"csv": ".csv", "parquet": ".parquet"}
+_article_sink = ThreadPoolExecutor(max_workers=1, thread_name_prefix="article-sink")
+
+def _write_articles(df, company_name, fmt):
+    file_path = os.path.join(DATA_DIR, f"{company_name}_news{ARTICLE_SINK_EXTENSIONS[fmt]}")
+    if df.empty:
         print(f"⚠️ No articles found for '{company_name}'.")
-    
-    return csv_file_path
+        return file_path
 
+    # Write to a private temp file and rename it into place, so concurrent
+    # runs for the same company never interleave writes to one file.
+    tmp_path = f"{file_path}.{uuid.uuid4().hex}.tmp"
+    try:
+        if fmt == "parquet":
+            df.to_parquet(tmp_path, index=False)
+        else:
+            df.to_csv(tmp_path, index=False)
+        os.replace(tmp_path, file_path)
+    except Exception as e:
+        print(f"⚠️ Error saving articles for '{company_name}' to '{file_path}': {e}")
+        raise
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    print(f"✅ Successfully saved {len(df)} articles in '{file_path}'.")
+    return file_path
 
-# Initialize stopwords and lemmatizer globally for efficiency
-stop_words = set(nltk.corpus.stopwords.words('english'))
-lemmatizer = nltk.WordNetLemmatizer()
+def persist_articles(df, company_name, fmt=None):
+    """Save extracted articles in the background; returns a Future of the file path.
 
-# Cleaning and Preprocessing Functions
-def clean_and_preprocess(text):
-    """Clean text by removing HTML tags, special characters, and stopwords."""
-    # Handle NaN or invalid values
-    if pd.isnull(text) or not isinstance(text, str) or text.strip() == "":
-        return ""
-    
-    # 1. Remove HTML tags
-    text = BeautifulSoup(text, "html.parser").get_text()
-    
-    # 2. Remove special characters, numbers, and punctuation
-    text = re.sub(r"[^a-zA-Z\s]", "", text).lower().strip()
-    
-    # 3. Tokenize
-    tokens = nltk.word_tokenize(text)
-    
-    # 4. Remove stopwords and apply lemmatization
-    filtered_tokens = [lemmatizer.lemmatize(word) for word in tokens if word not in stop_words]
-    
-    # 5. Join tokens back to string
-    return " ".join(filtered_tokens)
-
-
-#  Perform Sentiment Analysis
-def get_sentiment(text):
-    """Perform sentiment analysis on a given text."""
-    if pd.isnull(text) or text == "":
-        return "Neutral"
-    sentiment_score = sia.polarity_scores(text)
-    if sentiment_score['compound'] >= 0.05:
-        return "Positive"
-    elif sentiment_score['compound'] <= -0.05:
-        return "Negative"
-    else:
-        return "Neutral"
+    Returns ``None`` when persistence is disabled (``fmt="none"``).
+    """
+    fmt = fmt or ARTICLES_SINK_FORMAT
+    if fmt == "none":
+        return None
+    if fmt not in ARTICLE_SINK_EXTENSIONS:
+        raise ValueError(f"Unknown articles sink format '{fmt}'. Choose one of: csv, parquet, none")
+    return _article_sink.submit(_write_articles, df[ARTICLE_COLUMNS].copy(), company_name, fmt)
 
-# Extract Topics using NER
-def extract_topics_ner(text):
-    """Extract relevant topics using spaCy NER."""
-    if pd.isnull(text) or text.strip() == "":
-        return []
-    
-    doc = nlp(text)
-    topics = set()
+def _timed_batches(batches, stage):
+    """Yield from ``batches``, recording only the time spent producing them as ``stage``."""
+    elapsed = 0.0
+    count = 0
+    try:
+        while True:
+            start = time.perf_counter()
+            try:
+                batch = next(batches)
+            except StopIteration:
+                break
+            finally:
+                elapsed += time.perf_counter() - start
+            count += len(batch)
+            yield batch
+    finally:
+        batches.close()
+        STAGE_DURATION.observe(elapsed, stage=stage)
+        log_span(stage, elapsed, articles=count)
 
-    # Extract entities related to organizations, products, locations, and events
-    for ent in doc.ents:
-        if ent.label_ in ["ORG", "PRODUCT", "GPE", "EVENT"]:
-            topics.add(ent.text)
+def extract_news(company_name, max_articles=30, rss_feeds=None):
+    """Extract news articles related to the company.
+
+    Returns the articles as an in-memory DataFrame (``ARTICLE_COLUMNS``); they
+    are also persisted in the background according to ``ARTICLES_SINK_FORMAT``.
+    """
+    batches = list(_timed_batches(iter_news(company_name, max_articles, rss_feeds), "extract"))
+    df = pd.concat(batches, ignore_index=True) if batches else pd.DataFrame(columns=ARTICLE_COLUMNS)
+    persist_articles(df, company_name)
+    return df
 
-    return list(topics)
 
 # Generate Hindi Text-to-Speech (TTS) Summary
-def generate_tts(summary_text, output_file="sentiment_summary_hindi.mp3"):
-    """Generate a Hindi TTS audio from the summary text."""
-    tts = gTTS(text=summary_text, lang='hi')
-    output_path = os.path.join(OUTPUT_DIR, output_file)
-    tts.save(output_path)
-    return output_path
+# Audio is stored content-addressed (tts_<hash>.mp3) so identical summaries
+# are synthesized once. TTS_BACKEND=offline swaps gTTS for a local stand-in.
+TTS_BACKEND = os.getenv("TTS_BACKEND", "gtts")
+TTS_LANGUAGE = "hi"
+audio_store = AudioStore(
+    OUTPUT_DIR,
+    get_tts_backend(TTS_BACKEND),
+    max_bytes=int(os.getenv("AUDIO_STORE_MAX_BYTES", 200 * 1024 * 1024)),
+)
+registry.register_collector("audio_store", "Audio store counter / occupancy.", lambda: audio_store.stats())
+
+def generate_tts(summary_text, output_file=None):
+    """Generate a Hindi TTS audio from the summary text.
+
+    Returns the path of the cached audio for this text, synthesizing it only
+    on a cache miss. Passing ``output_file`` writes to that fixed file name
+    instead (bypassing the store).
+    """
+    with time_stage("tts"):
+        if output_file is None:
+            return audio_store.get_or_create(summary_text, TTS_LANGUAGE)
+        output_path = os.path.join(OUTPUT_DIR, output_file)
+        audio_store.backend.synthesize(summary_text, TTS_LANGUAGE, output_path)
+        return output_path
 
 # Generate Topic Overlap and Coverage Differences
-def get_topic_overlap(articles):
-    """Identify common and unique topics across articles."""
-    all_topics = [set(article['Topics']) for article in articles]
+# Both are read from one inverted topic index (topic -> articles, sentiment
+# split, sources). TOPIC_TOP_K bounds the shared topics reported.
+TOPIC_TOP_K = int(os.getenv("TOPIC_TOP_K", 10))
+
+def article_sources(feeds, keys, duplicates):
+    """Feeds that carried each article, including those of its collapsed near-duplicates."""
+    if duplicates is None:
+        return [[feed] for feed in feeds]
+    return [duplicates.sources(key) or [feed] for feed, key in zip(feeds, keys)]
+
+def get_topic_overlap(articles, sources=None, top_k=TOPIC_TOP_K, index=None):
+    """Identify common and unique topics across articles.
+
+    Besides the topics common to all articles and each article's other
+    topics, reports the ``top_k`` most shared topics with their sentiment
+    split and, when ``sources`` are given, the topics only one source covered.
+    """
+    if index is None:
+        index = TopicIndex.build(articles, sources)
 
     # Find common topics
-    common_topics = set.intersection(*all_topics) if all_topics else set()
+    common_topics = index.common()
 
     # Find unique topics per article
+    common = set(common_topics)
     unique_topics = [
-        list(topics - common_topics) for topics in all_topics
+        [topic for topic in dict.fromkeys(article['Topics']) if topic not in common] for article in articles
     ]
 
     return {
-        "Common Topics": list(common_topics),
-        "Unique Topics": unique_topics
+        "Common Topics": common_topics,
+        "Unique Topics": unique_topics,
+        "Top Shared Topics": [index.summary(topic) for topic in index.top_shared(top_k)],
+        "Source Unique Topics": index.unique_to_source(),
     }
 
-def generate_coverage_differences(articles):
-    """Generate coverage differences between articles."""
+def _article_numbers(positions, limit=5):
+    numbers = ", ".join(str(position + 1) for position in positions[:limit])
+    more = f" and {len(positions) - limit} more" if len(positions) > limit else ""
+    return f"{'article' if len(positions) == 1 else 'articles'} {numbers}{more}"
+
+def generate_coverage_differences(articles, top_k=TOPIC_TOP_K, index=None):
+    """Generate coverage differences between articles.
+
+    For each of the ``top_k`` most shared topics on which the articles
+    disagree, lists which articles cover it with which sentiment. Without
+    such topics, falls back to comparing adjacent articles.
+    """
+    if index is None:
+        index = TopicIndex.build(articles)
     differences = []
+    for topic in index.top_shared(top_k):
+        by_sentiment = {}
+        for position in index.positions(topic):
+            by_sentiment.setdefault(articles[position]['Sentiment'], []).append(position)
+        if len(by_sentiment) < 2:
+            continue
+        split = index.sentiment(topic)
+        counts = sorted((len(positions) for positions in by_sentiment.values()), reverse=True)
+        dominant = max(by_sentiment, key=lambda label: len(by_sentiment[label]))
+        leaning = "no sentiment dominates" if counts[0] == counts[1] else f"{dominant.lower()} sentiment dominates"
+        average = "n/a" if split["Average Score"] is None else f"{split['Average Score']:+.2f}"
+        differences.append({
+            "Comparison": f"{topic} is covered by {index.count(topic)} articles: " + "; ".join(
+                f"{label.lower()} in {_article_numbers(positions)}" for label, positions in by_sentiment.items()
+            ) + ".",
+            "Impact": f"Coverage of {topic} is divided; {leaning} (average score {average}).",
+        })
+    if differences:
+        return differences
+
     if len(articles) > 1:
         for i in range(len(articles) - 1):
             if not isinstance(articles[i]['Summary'], str) or not isinstance(articles[i+1]['Summary'], str):
@@ -239,10 +667,8 @@ def generate_coverage_differences(articles):
     return differences
 
 # Generate Final Sentiment Analysis Summary
-def generate_sentiment_summary(df, company_name):
-    """Generate sentiment summary from analyzed articles."""
-    # Count sentiment distribution
-    title_sentiment_counts = df['Title_Sentiment'].value_counts().to_dict()
+def build_sentiment_summary(company_name, title_sentiment_counts):
+    """Build the final verdict and the Hindi TTS script from the sentiment counts."""
     positive_count = title_sentiment_counts.get('Positive', 0)
     negative_count = title_sentiment_counts.get('Negative', 0)
 
@@ -262,77 +688,382 @@ def generate_sentiment_summary(df, company_name):
     तटस्थ लेख: {title_sentiment_counts.get('Neutral', 0)}
     अंतिम विश्लेषण: {final_summary}
     """
+    return final_summary, summary_text
+
+def generate_sentiment_summary(df, company_name, sentiment_distribution=None):
+    """Generate sentiment summary from analyzed articles."""
+    # Count sentiment distribution
+    title_sentiment_counts = sentiment_distribution or count_sentiments(df['Title_Sentiment'])
+    final_summary, summary_text = build_sentiment_summary(company_name, title_sentiment_counts)
     audio_file_path = generate_tts(summary_text)
 
     return final_summary, audio_file_path
 
-def save_final_report(company_name, articles_data, topic_overlap, coverage_differences, final_summary, audio_file_path):
-    """Save the final sentiment report in JSON format."""
-    report = {
-        "Company": company_name,
-        "Articles": articles_data,
-        "Comparative Sentiment Score": {
-            "Sentiment Distribution": {
-                "Positive": sum(article['Sentiment'] == "Positive" for article in articles_data),
-                "Negative": sum(article['Sentiment'] == "Negative" for article in articles_data),
-                "Neutral": sum(article['Sentiment'] == "Neutral" for article in articles_data),
-            },
-            "Coverage Differences": coverage_differences,
-            "Topic Overlap": topic_overlap
-        },
-        "Final Sentiment Analysis": final_summary,
-        "Audio": audio_file_path
+def build_comparative_sentiment(sentiment_distribution, coverage_differences, topic_overlap):
+    """Assemble the "Comparative Sentiment Score" block of the report."""
+    return {
+        "Sentiment Distribution": sentiment_distribution,
+        "Coverage Differences": coverage_differences,
+        "Topic Overlap": topic_overlap
     }
 
-    json_file_path = os.path.join(OUTPUT_DIR, f"{company_name}_comparative_sentiment_report.json")
-    with open(json_file_path, "w", encoding="utf-8") as f:
-        json.dump(report, f, ensure_ascii=False, indent=4)
-    
+def build_report(company_name, articles_data, topic_overlap, coverage_differences, final_summary, audio_file_path,
+                 sentiment_distribution=None):
+    """Assemble the final sentiment report as a typed in-memory object."""
+    if sentiment_distribution is None:
+        sentiment_distribution = count_sentiments([article['Sentiment'] for article in articles_data])
+    return Report(
+        company=company_name,
+        articles=articles_data,
+        comparative_sentiment_score=build_comparative_sentiment(sentiment_distribution, coverage_differences, topic_overlap),
+        final_sentiment_analysis=final_summary,
+        audio=audio_file_path,
+    )
+
+# The report is handed to the caller in memory; writing it to
+# output/{company}_comparative_sentiment_report.json happens on a background
+# writer by default. REPORT_PERSIST: background, sync or none.
+REPORT_PERSIST = os.getenv("REPORT_PERSIST", "background")
+_report_sink = ThreadPoolExecutor(max_workers=1, thread_name_prefix="report-sink")
+
+def report_file_path(company_name):
+    return os.path.join(OUTPUT_DIR, f"{company_name}_comparative_sentiment_report.json")
+
+def _write_report(report, json_file_path):
+    try:
+        report.write(json_file_path)
+    except Exception as e:
+        print(f"⚠️ Error saving report to '{json_file_path}': {e}")
+        raise
     print(f"✅ Final report saved to '{json_file_path}'.")
     return json_file_path
 
+def persist_report(report, mode=None):
+    """Save a report as JSON; returns its file path, or ``None`` when persistence is off.
+
+    In ``background`` mode the file appears shortly after this returns.
+    """
+    mode = mode or REPORT_PERSIST
+    if mode == "none":
+        return None
+    if mode not in ("background", "sync"):
+        raise ValueError(f"Unknown report persistence mode '{mode}'. Choose one of: background, sync, none")
+    json_file_path = report_file_path(report.company)
+    if mode == "background":
+        _report_sink.submit(_write_report, report, json_file_path)
+        return json_file_path
+    return _write_report(report, json_file_path)
+
+def save_final_report(company_name, articles_data, topic_overlap, coverage_differences, final_summary, audio_file_path,
+                      sentiment_distribution=None):
+    """Save the final sentiment report in JSON format (synchronously)."""
+    report = build_report(company_name, articles_data, topic_overlap, coverage_differences, final_summary, audio_file_path,
+                          sentiment_distribution)
+    with time_stage("report"):
+        return persist_report(report, mode="sync")
+
 
 # Main Pipeline Function
-def run_pipeline(company_name):
-    """Main function to orchestrate the news extraction, sentiment analysis, and TTS."""
-    # Step 1: Extract news articles
-    csv_file_path = extract_news(company_name)
-    df = pd.read_csv(csv_file_path)
+PIPELINE_STAGES = ["extract", "clean", "sentiment", "topics", "compare", "tts", "report"]
 
-    # Step 2: Preprocess and clean the data
-    df['Cleaned_Title'] = df['Title'].apply(clean_and_preprocess)
-    df['Cleaned_Summary'] = df['Summary'].apply(clean_and_preprocess)
+def _stage_reporter(progress):
+    """Wrap a progress callback so each stage is only reported when first entered."""
+    entered = set()
 
-    # Step 3: Sentiment Analysis
-    df['Title_Sentiment'] = df['Cleaned_Title'].apply(get_sentiment)
-    df['Summary_Sentiment'] = df['Cleaned_Summary'].apply(get_sentiment)
+    def report(stage):
+        if progress is not None and stage not in entered:
+            entered.add(stage)
+            progress(stage)
+    return report
 
-    # Step 4: Extract Topics and Prepare Articles
-    articles_data = []
-    for idx, row in df.iterrows():
-        title_topics = extract_topics_ner(row['Title'])
-        summary_topics = extract_topics_ner(row['Summary'])
-        combined_topics = list(set(title_topics + summary_topics))
+# Per-article analysis results persist across runs, so steady-state runs only
+# analyze articles they have not seen before. ARTICLE_STORE_PATH="" disables it.
+ARTICLE_STORE_PATH = os.getenv("ARTICLE_STORE_PATH", os.path.join(DATA_DIR, "articles.sqlite3"))
+ARTICLE_STORE_MAX_AGE = float(os.getenv("ARTICLE_STORE_MAX_AGE", 7 * 24 * 3600))
+article_store = ArticleStore(ARTICLE_STORE_PATH) if ARTICLE_STORE_PATH else None
+if article_store is not None:
+    registry.register_collector("article_store", "Article store counter / occupancy.", lambda: article_store.stats())
+
+# Every run's article sentiment is appended to a per-company time series with
+# rolling 1h / 24h / 7d aggregates (GET /trend/{company}). TREND_STORE_PATH=""
+# disables it.
+TREND_STORE_PATH = os.getenv("TREND_STORE_PATH", os.path.join(DATA_DIR, "trends.sqlite3"))
+TREND_STORE_MAX_AGE = float(os.getenv("TREND_STORE_MAX_AGE", 90 * 24 * 3600))
+trend_store = TrendStore(TREND_STORE_PATH) if TREND_STORE_PATH else None
+if trend_store is not None:
+    registry.register_collector("trend_store", "Sentiment time series occupancy.", lambda: trend_store.stats())
+
+def record_trend(company_name, keys, published, articles_data):
+    """Append the articles' publication times and title sentiment to the company's time series."""
+    if trend_store is None:
+        return 0
+    return trend_store.add(normalize_company_name(company_name), [
+        (key, parse_published(when), article['Sentiment Score'], article['Sentiment'])
+        for key, when, article in zip(keys, published, articles_data)
+    ])
 
+# NLP_WORKERS > 0 runs cleaning, VADER and NER for batches of at least
+# NLP_POOL_MIN_ARTICLES new articles on a pool of pre-warmed worker processes.
+# The default lets a single-company run (max_articles=30) reach the pool.
+NLP_WORKERS = int(os.getenv("NLP_WORKERS", 0))
+NLP_POOL_MIN_ARTICLES = int(os.getenv("NLP_POOL_MIN_ARTICLES", 16))
+nlp_pool = NLPPool(NLP_WORKERS, NLP_POOL_MIN_ARTICLES)
+
+def analyze_rows(titles, summaries, progress):
+    """Analyze new articles on the NLP process pool when enabled and worthwhile, else in-process."""
+    if nlp_pool.use_for(len(titles)):
+        progress("clean")
+        try:
+            with time_stage("nlp_pool", articles=len(titles)):
+                return nlp_pool.map_chunks(analysis.analyze_chunk, list(titles), list(summaries))
+        except Exception as e:
+            print(f"⚠️ NLP process pool failed ({e}). Analyzing in-process...")
+            nlp_pool.reset()
+    return analysis.analyze_rows(titles, summaries, progress, time_stage)
+
+def analyze_articles(df, progress=None):
+    """Clean, score and tag a batch of extracted articles.
+
+    Articles already in the article store are read back instead of being
+    analyzed again. Adds the cleaned text, sentiment score and label columns
+    to ``df`` and returns the article entries for the report, in row order.
+    """
+    progress = progress or (lambda stage: None)
+
+    keys = [article_key(link, title) for link, title in zip(df['Link'], df['Title'])]
+    stored = article_store.get_many(keys) if article_store is not None else {}
+    new_rows = {}
+    for i, key in enumerate(keys):
+        if key not in stored:
+            new_rows.setdefault(key, i)
+    if new_rows:
+        positions = list(new_rows.values())
+        analyzed = dict(zip(new_rows, analyze_rows(
+            list(df['Title'].iloc[positions]), list(df['Summary'].iloc[positions]), progress
+        )))
+        if article_store is not None:
+            article_store.put_many(analyzed)
+        stored.update(analyzed)
+    for stage in ("clean", "sentiment", "topics"):
+        progress(stage)
+
+    rows = [stored[key] for key in keys]
+    df['Cleaned_Title'] = [row['cleaned_title'] for row in rows]
+    df['Cleaned_Summary'] = [row['cleaned_summary'] for row in rows]
+    for field in SENTIMENT_FIELDS:
+        df[f'Title_{field.capitalize()}'] = np.array([row[f'title_{field}'] for row in rows], dtype=float)
+        df[f'Summary_{field.capitalize()}'] = np.array([row[f'summary_{field}'] for row in rows], dtype=float)
+    df['Title_Sentiment'] = sentiment_labels(df['Title_Compound'])
+    df['Summary_Sentiment'] = sentiment_labels(df['Summary_Compound'])
+
+    # Prepare Articles
+    articles_data = []
+    for row, info in zip(df.itertuples(index=False), rows):
         article_info = {
-            "Title": row['Title'],
-            "Summary": row['Summary'],
-            "Sentiment": row['Title_Sentiment'],
-            "Topics": combined_topics
+            "Title": row.Title,
+            "Summary": row.Summary,
+            "Sentiment": row.Title_Sentiment,
+            "Sentiment Score": finite_or_none(round(float(row.Title_Compound), 4)),
+            "Topics": list(info['topics'])
         }
         articles_data.append(article_info)
+    return articles_data
+
+def iter_pipeline(company_name, max_articles=30, rss_feeds=None, ordered=True, progress=None, persist=None,
+                  stream=True):
+    """Run the pipeline as a stream of events.
+
+    Yields ``{"event": ..., "data": ...}`` dicts:
+
+    - ``article`` for each article as soon as its feed batch is analyzed,
+    - ``summary`` with the "Comparative Sentiment Score" block and the final verdict,
+    - ``audio`` with the path of the Hindi TTS summary,
+    - ``report`` with the ``Report`` object and the paths of the JSON report
+      (``None`` with ``REPORT_PERSIST=none``) and audio file.
+
+    ``ordered=False`` analyzes feeds in download-completion order so the
+    first articles do not wait for slower feeds listed before them.
+    ``persist`` overrides ``REPORT_PERSIST`` for this run. With
+    ``stream=False`` and the NLP pool enabled, all feed batches are analyzed
+    together so the run is large enough for the pool.
+    """
+    progress = _stage_reporter(progress)
 
+    # Step 1: Extract news articles, analyzing them feed by feed (Steps 2-4)
+    progress("extract")
+    duplicates = new_duplicate_index()
+    batches = []
+    articles_data = []
+    keys = []
+    extracted = _timed_batches(iter_news(company_name, max_articles, rss_feeds, ordered=ordered, duplicates=duplicates), "extract")
+    if not stream and nlp_pool.enabled:
+        extracted = list(extracted)
+        extracted = [pd.concat(extracted, ignore_index=True)] if extracted else []
+    for df in extracted:
+        batch_keys = [article_key(link, title) for link, title in zip(df['Link'], df['Title'])]
+        batch_articles = with_source_counts(analyze_articles(df, progress), batch_keys, duplicates)
+        batches.append(df)
+        keys.extend(batch_keys)
+        for article_info in batch_articles:
+            articles_data.append(article_info)
+            yield {"event": "article", "data": article_info}
+    # Copies found in later feeds raise the counts of articles already streamed
+    with_source_counts(articles_data, keys, duplicates)
+
+    all_articles = pd.concat(batches, ignore_index=True) if batches else pd.DataFrame(columns=ARTICLE_COLUMNS)
+    persist_articles(all_articles, company_name)
+    record_trend(company_name, keys, all_articles['Published'], articles_data)
+    sentiment_distribution = count_sentiments(
+        np.concatenate([df['Title_Sentiment'].to_numpy() for df in batches]) if batches else []
+    )
+    sources = article_sources([feed for df in batches for feed in df['Source']], keys, duplicates)
+    yield from _iter_report_events(company_name, articles_data, sentiment_distribution, progress, sources, persist)
+
+def _iter_report_events(company_name, articles_data, sentiment_distribution, progress, sources=None, persist=None):
+    """Steps 5-7 of the pipeline for already analyzed articles: summary, audio and report events."""
     # Step 5: Generate Topic Overlap and Coverage Differences
-    topic_overlap = get_topic_overlap(articles_data)
-    coverage_differences = generate_coverage_differences(articles_data)
+    progress("compare")
+    with time_stage("compare", articles=len(articles_data)):
+        topic_index = TopicIndex.build(articles_data, sources)
+        topic_overlap = get_topic_overlap(articles_data, index=topic_index)
+        coverage_differences = generate_coverage_differences(articles_data, index=topic_index)
+    final_summary, summary_text = build_sentiment_summary(company_name, sentiment_distribution)
+    yield {"event": "summary", "data": {
+        "Comparative Sentiment Score": build_comparative_sentiment(sentiment_distribution, coverage_differences, topic_overlap),
+        "Final Sentiment Analysis": final_summary,
+    }}
+
+    # Step 6: Generate the Hindi TTS summary
+    progress("tts")
+    audio_file_path = generate_tts(summary_text)
+    yield {"event": "audio", "data": {"Audio": audio_file_path}}
+
+    # Step 7: Build the final report (saved to JSON in the background)
+    progress("report")
+    with time_stage("report"):
+        report = build_report(company_name, articles_data, topic_overlap, coverage_differences, final_summary, audio_file_path,
+                              sentiment_distribution)
+        json_file_path = persist_report(report, persist)
+    yield {"event": "report", "data": {"report": report, "report_path": json_file_path, "audio_path": audio_file_path}}
+
+def run_pipeline(company_name, progress=None):
+    """Main function to orchestrate the news extraction, sentiment analysis, and TTS.
+
+    ``progress`` is an optional callback called with each stage name from
+    ``PIPELINE_STAGES`` as the pipeline enters it. The JSON report is
+    written before this returns, so the returned path can be opened right away.
+    """
+    for event in iter_pipeline(company_name, progress=progress, persist="sync", stream=False):
+        if event["event"] == "report":
+            return event["data"]["report_path"], event["data"]["audio_path"]
+
+# ============================
+#  Multi-Company Batch Pipeline
+# ============================
+def _route_entries(entries, keyword_matcher):
+    """Strip and keyword-match every entry of a feed once, for all companies of the matcher.
+
+    Returns ``(title, summary, link, published, companies)`` tuples in feed order.
+    """
+    routed = []
+    for entry in entries:
+        title = entry.get('title', '').strip()
+        summary_cleaned = strip_html(entry.get('summary', '').strip())
+        companies = keyword_matcher.match(title, summary_cleaned)
+        routed.append((title, summary_cleaned, entry.get('link', '').strip(), entry.get('published', '').strip(), companies))
+    return routed
+
+def _select_articles(company_name, company_feeds, routed_feeds, max_articles, duplicates=None):
+    """Pick a company's articles from routed feeds, exactly as ``iter_news(ordered=True)`` would."""
+    columns = {column: [] for column in ARTICLE_COLUMNS}
+    seen_titles = {}
+    company_key = normalize_company_name(company_name)
+    for rss_url in company_feeds:
+        routed = routed_feeds.get(rss_url)
+        if routed is None:
+            continue
+        matched = 0
+        for title, summary, link, published, companies in routed:
+            if len(columns['Title']) >= max_articles:
+                break
+            if title in seen_titles:
+                _count_repeat(duplicates, seen_titles, title, rss_url)
+                continue
+            if company_name not in companies:
+                continue
+            if _is_near_duplicate(duplicates, title, summary, link, rss_url):
+                continue
+            for column, value in zip(ARTICLE_COLUMNS, (title, summary, link, published, rss_url)):
+                columns[column].append(value)
+            seen_titles[title] = article_key(link, title)
+            matched += 1
+        FEED_ARTICLES_MATCHED.inc(matched, feed=feed_label(rss_url))
+        feed_health.record_yield(rss_url, company_key, matched)
+        if len(columns['Title']) >= max_articles:
+            break
+    return pd.DataFrame(columns, columns=ARTICLE_COLUMNS)
+
+def run_pipeline_many(company_names, max_articles=30, rss_feeds=None, progress=None):
+    """Run the pipeline for several companies, sharing fetching and NLP work.
 
-    # Step 6: Generate Final Sentiment Summary and TTS
-    final_summary, audio_file_path = generate_sentiment_summary(df, company_name)
+    Every distinct feed is downloaded once and its entries are matched
+    against all companies in one pass. Articles selected by several companies
+    are cleaned, scored and tagged once; reports and audio are then produced
+    per company. Returns ``{company_name: report_event_data}``, i.e. the
+    ``Report`` and the report / audio paths (see ``iter_pipeline``).
+    """
+    progress = _stage_reporter(progress)
+    company_names = unique_company_names(company_names)
+    company_feeds = {
+        name: feed_health.prioritize(
+            list(dict.fromkeys(rss_feeds if rss_feeds is not None else RSS_FEEDS + [google_news_feed_url(name)])),
+            normalize_company_name(name),
+            max_articles,
+        )
+        for name in company_names
+    }
 
-    # Step 7: Save Final Report in JSON
-    json_file_path = save_final_report(company_name, articles_data, topic_overlap, coverage_differences, final_summary, audio_file_path)
+    # Step 1: Fetch each distinct feed once and route its entries to companies
+    progress("extract")
+    with time_stage("extract", companies=len(company_names)):
+        all_feeds = list(dict.fromkeys(url for feeds in company_feeds.values() for url in feeds))
+        keyword_matcher = build_keyword_matcher(company_names)
+        routed_feeds = {
+            rss_url: _route_entries(entries, keyword_matcher)
+            for rss_url, entries in iter_feed_entries(all_feeds) if entries is not None
+        }
+        duplicates = {name: new_duplicate_index() for name in company_names}
+        company_articles = {
+            name: _select_articles(name, company_feeds[name], routed_feeds, max_articles, duplicates[name])
+            for name in company_names
+        }
+
+    # Steps 2-4: Analyze every distinct article once
+    keys = {
+        name: [article_key(link, title) for link, title in zip(df['Link'], df['Title'])]
+        for name, df in company_articles.items()
+    }
+    unique = pd.concat(company_articles.values(), ignore_index=True) if company_articles else pd.DataFrame(columns=ARTICLE_COLUMNS)
+    unique = unique.drop_duplicates(subset=['Link', 'Title'], ignore_index=True)
+    analyzed = dict(zip(
+        (article_key(link, title) for link, title in zip(unique['Link'], unique['Title'])),
+        analyze_articles(unique, progress) if not unique.empty else [],
+    ))
 
-    return json_file_path, audio_file_path
+    # Steps 5-7: Fan out per-company reports and audio
+    results = {}
+    for name in company_names:
+        persist_articles(company_articles[name], name)
+        articles_data = with_source_counts(
+            [dict(analyzed[key], Topics=list(analyzed[key]['Topics'])) for key in keys[name]], keys[name], duplicates[name]
+        )
+        record_trend(name, keys[name], company_articles[name]['Published'], articles_data)
+        sentiment_distribution = count_sentiments([article['Sentiment'] for article in articles_data])
+        sources = article_sources(list(company_articles[name]['Source']), keys[name], duplicates[name])
+        for event in _iter_report_events(name, articles_data, sentiment_distribution, progress, sources):
+            if event["event"] == "report":
+                results[name] = event["data"]
+    return results
 
 
 # if __name__ == "__main__":
@@ -0,0 +1,8 @@
+import os
+import sys
+
+# Keep the module-level stores of src.utils out of the working tree
+os.environ.setdefault("ARTICLE_STORE_PATH", "")
+os.environ.setdefault("TREND_STORE_PATH", "")
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
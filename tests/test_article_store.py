@@ -0,0 +1,78 @@
+import pytest
+
+from src import article_store as article_store_module
+from src.article_store import SCORE_COLUMNS, ArticleStore, article_key
+
+
+class Clock:
+    def __init__(self, now):
+        self.now = now
+
+    def time(self):
+        return self.now
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = ArticleStore(str(tmp_path / "articles.sqlite3"))
+    yield store
+    store.close()
+
+
+def row(name, topics=("Acme",)):
+    values = {"cleaned_title": f"{name} title", "cleaned_summary": f"{name} summary", "topics": list(topics)}
+    values.update({column: 0.1 * i for i, column in enumerate(SCORE_COLUMNS)})
+    return values
+
+
+def test_rows_round_trip(store):
+    rows = {"a": row("a", ["Acme", "Zürich"]), "b": row("b", [])}
+    store.put_many(rows)
+    assert store.get_many(["a", "b", "missing", "a"]) == rows
+    stats = store.stats()
+    assert (stats["hits"], stats["misses"], stats["articles"]) == (2, 1, 2)
+
+
+def test_put_replaces_existing_rows(store):
+    store.put_many({"a": row("a")})
+    store.put_many({"a": row("a", ["Globex"])})
+    assert store.get_many(["a"])["a"]["topics"] == ["Globex"]
+    assert store.stats()["articles"] == 1
+
+
+def test_lookups_beyond_the_parameter_limit(store):
+    rows = {f"k{i}": row(f"k{i}") for i in range(1200)}
+    store.put_many(rows)
+    assert store.get_many(list(rows)) == rows
+
+
+def test_rows_persist_across_connections(tmp_path):
+    path = str(tmp_path / "articles.sqlite3")
+    store = ArticleStore(path)
+    store.put_many({"a": row("a")})
+    store.close()
+
+    reopened = ArticleStore(path)
+    assert reopened.get_many(["a"]) == {"a": row("a")}
+    reopened.close()
+
+
+def test_prune_deletes_rows_older_than_max_age(store, monkeypatch):
+    clock = Clock(1000.0)
+    monkeypatch.setattr(article_store_module, "time", clock)
+    store.put_many({"old": row("old")})
+    clock.now = 2000.0
+    store.put_many({"new": row("new")})
+
+    clock.now = 2500.0
+    assert store.prune(1000) == 1
+    assert list(store.get_many(["old", "new"])) == ["new"]
+
+
+def test_article_key_depends_on_link_title_and_version(monkeypatch):
+    key = article_key("http://news.test/1", "Acme buys Globex")
+    assert key == article_key("http://news.test/1", "Acme buys Globex")
+    assert key != article_key("http://news.test/2", "Acme buys Globex")
+    assert key != article_key("http://news.test/1", "Acme sells Globex")
+    monkeypatch.setattr(article_store_module, "ANALYSIS_VERSION", article_store_module.ANALYSIS_VERSION + 1)
+    assert key != article_key("http://news.test/1", "Acme buys Globex")
@@ -0,0 +1,107 @@
+import os
+import threading
+import time
+
+from src.audio_store import AudioStore, OfflineTTSBackend, content_etag
+
+FRAME = len(OfflineTTSBackend.SILENT_FRAME)
+
+
+class CountingBackend(OfflineTTSBackend):
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def synthesize(self, text, lang, output_path):
+        with self._lock:
+            self.calls += 1
+        time.sleep(self.delay)
+        super().synthesize(text, lang, output_path)
+
+
+def test_identical_text_is_synthesized_once(tmp_path):
+    backend = CountingBackend()
+    store = AudioStore(str(tmp_path), backend)
+    first = store.get_or_create("नमस्ते", "hi")
+    second = store.get_or_create("नमस्ते", "hi")
+    other = store.get_or_create("नमस्ते", "en")
+
+    assert first == second != other
+    assert os.path.basename(first).startswith("tts_") and first.endswith(".mp3")
+    assert os.path.getsize(first) == FRAME * len("नमस्ते")
+    assert backend.calls == 2
+    stats = store.stats()
+    assert (stats["hits"], stats["misses"], stats["backend"]) == (1, 2, "offline")
+    assert not [name for name in os.listdir(tmp_path) if name.endswith(".tmp")]
+
+
+def test_concurrent_requests_share_one_synthesis(tmp_path):
+    backend = CountingBackend(delay=0.2)
+    store = AudioStore(str(tmp_path), backend)
+    paths = []
+    threads = [threading.Thread(target=lambda: paths.append(store.get_or_create("summary", "hi"))) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert backend.calls == 1
+    assert len(set(paths)) == 1 and len(paths) == 8
+
+
+def test_least_recently_used_files_are_evicted(tmp_path):
+    store = AudioStore(str(tmp_path), OfflineTTSBackend(), max_bytes=FRAME * 25)
+    old = store.get_or_create("a" * 10, "hi")
+    recent = store.get_or_create("b" * 10, "hi")
+    os.utime(old, (1000, 1000))
+    os.utime(recent, (2000, 2000))
+
+    newest = store.get_or_create("c" * 10, "hi")
+    assert not os.path.exists(old)
+    assert os.path.exists(recent) and os.path.exists(newest)
+    assert store.stats()["evictions"] == 1
+    assert store.lookup(os.path.basename(old)) is None
+
+
+def test_a_file_larger_than_the_store_is_kept(tmp_path):
+    store = AudioStore(str(tmp_path), OfflineTTSBackend(), max_bytes=FRAME)
+    path = store.get_or_create("a long summary", "hi")
+    assert os.path.exists(path)
+
+
+def test_lookup_serves_indexed_files_with_a_content_etag(tmp_path):
+    store = AudioStore(str(tmp_path), OfflineTTSBackend())
+    path = store.get_or_create("summary", "hi")
+    name = os.path.basename(path)
+
+    audio_file = store.lookup(name)
+    assert audio_file.path == path
+    assert audio_file.stat.st_size == os.path.getsize(path)
+    assert audio_file.etag == content_etag(path)
+
+    # A new store indexes the files already on disk
+    assert AudioStore(str(tmp_path), OfflineTTSBackend()).lookup(name).etag == audio_file.etag
+
+
+def test_lookup_picks_up_rewritten_plain_names(tmp_path):
+    store = AudioStore(str(tmp_path), OfflineTTSBackend())
+    path = os.path.join(tmp_path, "summary.mp3")
+    with open(path, "wb") as f:
+        f.write(b"first")
+    first = store.lookup("summary.mp3").etag
+    with open(path, "wb") as f:
+        f.write(b"second version")
+    os.utime(path, (3000, 3000))
+    assert store.lookup("summary.mp3").etag not in (None, first)
+
+
+def test_lookup_rejects_unsafe_names(tmp_path):
+    directory = tmp_path / "audio"
+    store = AudioStore(str(directory), OfflineTTSBackend())
+    (tmp_path / "secret.mp3").write_bytes(b"outside the store")
+    (directory / ".hidden.mp3").write_bytes(b"hidden")
+    (directory / "folder.mp3").mkdir()
+
+    for name in ("../secret.mp3", "..%2Fsecret.mp3", ".hidden.mp3", "a/b.mp3", "notes.txt", "folder.mp3", "missing.mp3"):
+        assert store.lookup(name) is None, name
@@ -0,0 +1,77 @@
+from benchmarks.run_benchmarks import FixtureServer
+from src import utils
+from src.dedup import NUM_PERM, NearDuplicateIndex, optimal_bands
+
+STORY = ("Acme Corp agreed to buy its rival Globex for twelve billion dollars in cash, "
+         "the largest deal in the industry this year, pending approval by regulators in three countries")
+
+
+def rss(*items):
+    body = "".join(
+        f"<item><title>{title}</title><description>{summary}</description><link>{link}</link></item>"
+        for title, summary, link in items
+    )
+    return f'<?xml version="1.0"?><rss version="2.0"><channel><title>t</title>{body}</channel></rss>'.encode("utf-8")
+
+
+def test_near_duplicates_join_the_first_cluster():
+    index = NearDuplicateIndex(0.6)
+    assert index.add("a", "Acme buys Globex\n" + STORY, "feed-1") == "a"
+    assert index.add("b", "Acme to acquire Globex\n" + STORY, "feed-2") == "a"
+    assert index.add("c", "Weather turns cold across the north as winter storms arrive early", "feed-3") == "c"
+
+    assert index.source_count("a") == 2
+    assert index.sources("a") == ["feed-1", "feed-2"]
+    assert index.source_count("c") == 1
+    assert index.source_count("b") == 0   # not a representative
+
+
+def test_add_copy_counts_exact_repeats():
+    index = NearDuplicateIndex(0.6)
+    index.add("a", STORY, "feed-1")
+    index.add_copy("a", "feed-2")
+    assert index.sources("a") == ["feed-1", "feed-2"]
+
+
+def test_optimal_bands_fit_the_signature_and_track_the_threshold():
+    for threshold in (0.3, 0.6, 0.9):
+        bands, rows = optimal_bands(threshold)
+        assert bands * rows <= NUM_PERM
+        # The LSH S-curve's inflection point (1/b)^(1/r) sits near the threshold
+        assert abs((1 / bands) ** (1 / rows) - threshold) < 0.1
+    assert optimal_bands(0.3)[1] < optimal_bands(0.9)[1]
+
+
+def syndicated_feeds():
+    return FixtureServer({
+        "/one.xml": rss(("Acme buys Globex", STORY, "http://one.test/1")),
+        "/two.xml": rss(("Acme buys Globex", STORY, "http://two.test/1")),
+        "/three.xml": rss(("Acme to acquire Globex", STORY, "http://three.test/1")),
+    })
+
+
+def test_iter_news_counts_identical_and_reworded_copies():
+    server = syndicated_feeds()
+    try:
+        duplicates = utils.new_duplicate_index()
+        batches = list(utils.iter_news("Acme", rss_feeds=server.urls, duplicates=duplicates))
+    finally:
+        server.close()
+
+    assert [title for df in batches for title in df["Title"]] == ["Acme buys Globex"]
+    key = utils.article_key("http://one.test/1", "Acme buys Globex")
+    assert duplicates.source_count(key) == 3
+    assert duplicates.sources(key) == server.urls
+
+
+def test_batch_selection_counts_identical_and_reworded_copies():
+    server = syndicated_feeds()
+    matcher = utils.build_keyword_matcher(["Acme"])
+    routed = {url: utils._route_entries(entries, matcher) for url, entries in utils.load_feeds(server.urls).items()}
+    server.close()
+
+    duplicates = utils.new_duplicate_index()
+    df = utils._select_articles("Acme", server.urls, routed, 30, duplicates)
+    assert list(df["Title"]) == ["Acme buys Globex"]
+    key = utils.article_key("http://one.test/1", "Acme buys Globex")
+    assert duplicates.source_count(key) == 3
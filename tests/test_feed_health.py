@@ -0,0 +1,58 @@
+from src.feed_health import FeedHealth
+
+
+def test_circuit_opens_after_threshold_and_backs_off():
+    health = FeedHealth(failure_threshold=3, base_backoff=30, max_backoff=100)
+    url = "http://feed.test/rss"
+    for _ in range(2):
+        health.record_failure(url, now=1000.0)
+    assert health.allow(url, now=1000.0)
+
+    health.record_failure(url, now=1000.0)
+    assert not health.allow(url, now=1010.0)
+    assert health.stats(now=1010.0)[url]["circuit"] == "open"
+
+    # Each further failure doubles the backoff, capped at max_backoff
+    health.record_failure(url, now=1000.0)
+    assert health._feeds[url].open_until == 1060.0
+    for _ in range(5):
+        health.record_failure(url, now=1000.0)
+    assert health._feeds[url].open_until == 1100.0
+
+
+def test_half_open_allows_a_single_probe():
+    health = FeedHealth(failure_threshold=1, base_backoff=30)
+    url = "http://feed.test/rss"
+    health.record_failure(url, now=1000.0)
+    assert not health.allow(url, now=1029.0)
+
+    assert health.stats(now=1031.0)[url]["circuit"] == "half-open"
+    assert health.allow(url, now=1031.0)
+    assert not health.allow(url, now=1032.0)
+    # A probe that never reports back expires after base_backoff
+    assert health.allow(url, now=1062.0)
+
+
+def test_probe_success_closes_and_failure_reopens():
+    health = FeedHealth(failure_threshold=1, base_backoff=30)
+    url = "http://feed.test/rss"
+    health.record_failure(url, now=1000.0)
+    assert health.allow(url, now=1031.0)
+    health.record_failure(url, now=1031.0)
+    assert not health.allow(url, now=1060.0)
+    assert health.allow(url, now=1092.0)
+    health.record_success(url, 0.1)
+    assert health.stats()[url]["circuit"] == "closed"
+    assert health.allow(url) and health.allow(url)
+
+
+def test_prioritize_keeps_known_feeds_first():
+    health = FeedHealth()
+    urls = ["a", "b", "c", "d"]
+    assert health.prioritize(urls, "acme", 10) == urls
+
+    health.record_yield("a", "acme", 2)
+    health.record_yield("c", "acme", 9)
+    assert health.prioritize(urls, "acme", 10) == ["c", "a", "b", "d"]
+    # Not enough known yield to reach the limit: every feed is walked in list order
+    assert health.prioritize(urls, "acme", 20) == urls
@@ -0,0 +1,89 @@
+import time
+
+import pytest
+
+from benchmarks.run_benchmarks import FixtureServer
+from src import utils
+
+
+def rss(*titles):
+    items = "".join(f"<item><title>{title}</title><link>http://news.test/{i}</link></item>" for i, title in enumerate(titles))
+    return f'<?xml version="1.0"?><rss version="2.0"><channel><title>t</title>{items}</channel></rss>'.encode("utf-8")
+
+
+@pytest.fixture
+def servers():
+    started = []
+
+    def start(delay=0.0, **feeds):
+        server = FixtureServer({f"/{name}.xml": content for name, content in feeds.items()}, delay=delay)
+        started.append(server)
+        return server
+
+    yield start
+    for server in started:
+        server.close()
+
+
+def test_deadline_abandons_slow_feeds(servers):
+    fast = servers(fast=rss("Fast story"))
+    slow = servers(delay=2.0, slow=rss("Slow story"))
+    urls = slow.urls + fast.urls
+
+    start = time.perf_counter()
+    results = dict(utils.iter_feed_entries(urls, timeout=5, deadline=0.5))
+    elapsed = time.perf_counter() - start
+
+    assert elapsed < 1.5
+    assert list(results) == fast.urls
+    assert [entry["title"] for entry in results[fast.urls[0]]] == ["Fast story"]
+
+
+def test_feeds_are_yielded_as_they_complete(servers):
+    slow = servers(delay=0.6, slow=rss("Slow story"))
+    fast = servers(fast=rss("Fast story"))
+
+    order = [url for url, _ in utils.iter_feed_entries(slow.urls + fast.urls, timeout=5, deadline=5)]
+    assert order == fast.urls + slow.urls
+
+
+def test_per_feed_timeout_yields_none(servers):
+    slow = servers(delay=1.0, slow=rss("Slow story"))
+    missing = servers(other=rss("Other"))
+    missing_url = missing.base_url + "/missing.xml"
+
+    results = dict(utils.iter_feed_entries(slow.urls + [missing_url], timeout=0.3, deadline=5))
+    assert results == {slow.urls[0]: None, missing_url: None}
+    assert utils.feed_health.stats()[slow.urls[0]]["failures"] == 1
+
+
+def test_fresh_cache_hits_skip_the_network(servers):
+    server = servers(feed=rss("Cached story"))
+    url = server.urls[0]
+    first = dict(utils.iter_feed_entries([url], timeout=5, deadline=5))
+    server.close()
+    second = dict(utils.iter_feed_entries([url], timeout=5, deadline=5))
+    assert second == first
+
+
+def test_slow_consumer_does_not_spend_the_deadline(servers):
+    first = servers(first=rss("First story"))
+    second = servers(delay=0.2, second=rss("Second story"))
+    urls = first.urls + second.urls
+
+    results = {}
+    for url, entries in utils.iter_feed_entries(urls, timeout=5, deadline=1.0):
+        results[url] = entries
+        time.sleep(1.5)   # analyzing a batch takes longer than the whole deadline
+    assert set(results) == set(urls)
+    assert all(entries is not None for entries in results.values())
+
+
+def test_failed_feeds_leave_match_yield_unchanged(servers):
+    server = servers(feed=rss("Acme story", "Other story"))
+    missing_url = server.base_url + "/missing.xml"
+    list(utils.iter_news("Acme", rss_feeds=server.urls + [missing_url]))
+
+    yields = utils.feed_health._yields["acme"]
+    assert yields[server.urls[0]] > 0
+    assert missing_url not in yields
@@ -0,0 +1,64 @@
+import threading
+
+import pytest
+
+from src.jobs import JobManager, JobQueueFull, batch_key, unique_company_names
+
+
+def test_done_jobs_always_have_finished_at():
+    release = threading.Event()
+
+    def func(company_name, progress=None):
+        release.wait(5)
+        return {"company": company_name}
+
+    manager = JobManager(func, ["extract"], max_workers=1, result_ttl=0)
+    job, created = manager.submit("Acme")
+    assert created
+    release.set()
+    # Pruning while the job finishes must never compare a missing finished_at
+    while not job.future.done():
+        manager.get(job.id)
+        assert not job.done or job.finished_at is not None
+    assert job.future.result() == {"company": "Acme"}
+    assert job.status == "succeeded"
+    manager.shutdown()
+
+
+def test_single_flight_and_failure_release():
+    def func(company_name, progress=None):
+        raise RuntimeError("boom")
+
+    manager = JobManager(func, ["extract"], max_workers=1)
+    job, _ = manager.submit("Acme")
+    try:
+        job.future.result(5)
+    except RuntimeError:
+        pass
+    assert job.status == "failed" and job.error == "boom" and job.finished_at is not None
+    second, created = manager.submit(" acme ")
+    assert created and second is not job
+    manager.shutdown()
+
+
+def test_unique_company_names_uses_normalized_names():
+    assert unique_company_names(["Amazon", " amazon ", "AMAZON", "", "Apple  Inc", "apple inc"]) == ["Amazon", "Apple  Inc"]
+
+
+def test_batch_jobs_share_the_queue_and_join_by_company_set():
+    release = threading.Event()
+
+    def batch(company_names, progress=None):
+        release.wait(5)
+        return {name: len(name) for name in company_names}
+
+    manager = JobManager(lambda company_name, progress=None: None, ["extract"], max_workers=1, max_queue=0)
+    job, created = manager.submit(["Acme", "Globex"], func=batch, key=batch_key(["Acme", "Globex"]))
+    assert created
+    joined, created = manager.submit(["globex", "ACME"], func=batch, key=batch_key(["globex", "ACME"]))
+    assert joined is job and not created
+    with pytest.raises(JobQueueFull):
+        manager.submit("Initech")
+    release.set()
+    assert job.future.result(5) == {"Acme": 4, "Globex": 6}
+    manager.shutdown()
@@ -0,0 +1,71 @@
+import random
+import re
+
+import pytest
+
+from src.utils import KeywordMatcher, build_keyword_matcher, generate_search_keywords
+
+
+KEYWORD_SETS = {
+    "Tesla": ["Tesla", "tesla model", "Tesla Model S", "elon musk", "gigafactory"],
+    "Model Co": ["model", "model s", "s&p", "a.i.", "ai"],
+    "Apple": ["apple", "apple inc", "apple's", "iphone"],
+    "Empty": ["", "musk"],
+}
+VOCABULARY = [
+    "tesla", "Tesla", "model", "Model", "s", "S", "model s", "elon", "musk", "Musk's", "gigafactory",
+    "s&p", "S&P500", "a.i.", "ai", "AI-driven", "apple", "apples", "apple's", "inc", "Inc.", "iphone",
+    "iPhone15", "the", "and", "stock", "-", ",", ".", "'", "&", "(", ")", "\n", "teslas", "pineapple",
+]
+
+
+def per_pattern_matches(keyword_sets, title, summary):
+    """The original matching: one \\bkeyword\\b search per keyword and text."""
+    matched = {}
+    for company, keywords in keyword_sets.items():
+        for keyword in keywords:
+            if not keyword:
+                continue
+            pattern = re.compile(rf"\b{re.escape(keyword.lower())}\b")
+            if pattern.search(title.lower()) or pattern.search(summary.lower()):
+                matched.setdefault(company, set()).add(keyword.lower())
+    return matched
+
+
+def random_text(rng):
+    return "".join(rng.choice(["", " "]) + rng.choice(VOCABULARY) for _ in range(rng.randint(0, 12)))
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_matches_per_pattern_regex(seed):
+    rng = random.Random(seed)
+    matcher = KeywordMatcher(KEYWORD_SETS)
+    for _ in range(200):
+        title, summary = random_text(rng), random_text(rng)
+        assert matcher.match(title, summary) == per_pattern_matches(KEYWORD_SETS, title, summary), (title, summary)
+
+
+def test_longer_match_implies_word_bounded_prefixes():
+    matcher = KeywordMatcher(KEYWORD_SETS)
+    assert matcher.match("New Tesla Model S deliveries", "") == {
+        "Tesla": {"tesla", "tesla model", "tesla model s"},
+        "Model Co": {"model", "model s"},
+    }
+    # "apple" is not a word-bounded prefix inside "pineapple"
+    assert matcher.match("pineapple", "") == {}
+
+
+def test_generated_keywords_match_like_separate_patterns():
+    companies = ["Tesla", "Apple", "Amazon", "Meta Platforms"]
+    keyword_sets = {name: generate_search_keywords(name) for name in companies}
+    matcher = build_keyword_matcher(companies)
+    rng = random.Random(3)
+    words = [keyword for keywords in keyword_sets.values() for keyword in keywords] + ["news", "stock", ",", "."]
+    for _ in range(300):
+        title = " ".join(rng.choice(words) for _ in range(rng.randint(0, 6)))
+        summary = " ".join(rng.choice(words) for _ in range(rng.randint(0, 6)))
+        assert matcher.match(title, summary) == per_pattern_matches(keyword_sets, title, summary)
+
+
+def test_no_keywords_matches_nothing():
+    assert KeywordMatcher({"Empty": [""]}).match("anything") == {}
@@ -0,0 +1,113 @@
+import os
+
+import pytest
+
+from src import report_cache as report_cache_module
+from src.report_cache import ReportCache
+
+
+class Clock:
+    def __init__(self, now):
+        self.now = now
+
+    def time(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock(1000.0)
+    monkeypatch.setattr(report_cache_module, "time", clock)
+    return clock
+
+
+def files(directory):
+    return sorted(name for name in os.listdir(directory) if name.endswith(".json"))
+
+
+def test_fresh_stale_and_expired_boundaries(clock, tmp_path):
+    cache = ReportCache(ttl=10, max_stale=100, directory=str(tmp_path))
+    cache.put("acme", {"report": 1})
+
+    clock.now = 1010.0
+    assert cache.get("acme") == ({"report": 1}, 10.0, False)
+    clock.now = 1010.5
+    assert cache.get("acme") == ({"report": 1}, 10.5, True)
+    clock.now = 1100.0
+    assert cache.get("acme")[2]
+
+    # Past max_stale the entry is a miss and is dropped from memory and disk
+    clock.now = 1100.5
+    assert cache.get("acme") is None
+    assert files(tmp_path) == []
+    stats = cache.stats()
+    assert (stats["hits"], stats["stale_hits"], stats["misses"]) == (1, 2, 1)
+    assert (stats["entries"], stats["disk_entries"]) == (0, 0)
+
+
+def test_entries_are_loaded_from_disk_with_their_age(clock, tmp_path):
+    ReportCache(ttl=10, directory=str(tmp_path)).put("acme", {"report": 1})
+
+    clock.now = 1020.0
+    cache = ReportCache(ttl=10, directory=str(tmp_path))
+    assert cache.stats()["disk_entries"] == 1
+    assert cache.get("acme") == ({"report": 1}, 20.0, True)
+    assert cache.age("acme") == 20.0
+    assert cache.get("globex") is None
+
+
+def test_invalidate_removes_memory_and_disk(clock, tmp_path):
+    cache = ReportCache(directory=str(tmp_path))
+    for key in ("acme", "globex", "initech"):
+        cache.put(key, {"report": key})
+
+    cache.invalidate("acme")
+    assert cache.get("acme") is None
+    assert len(files(tmp_path)) == 2
+
+    cache.invalidate()
+    assert cache.get("globex") is None
+    assert files(tmp_path) == []
+    assert cache.stats()["disk_entries"] == 0
+
+
+def test_memory_lru_is_bounded_by_entries_and_bytes(clock):
+    cache = ReportCache(max_entries=2)
+    for key in ("acme", "globex"):
+        cache.put(key, {"report": key})
+    cache.get("acme")
+    cache.put("initech", {"report": "initech"})
+    assert cache.age("globex") is None and cache.age("acme") is not None
+
+    small = ReportCache(max_bytes=40)
+    small.put("acme", {"report": "x" * 10})
+    small.put("globex", {"report": "x" * 10})
+    assert small.stats()["entries"] == 1 and small.stats()["evictions"] == 1
+
+
+def test_disk_mirror_is_bounded_and_keeps_recently_read_files(clock, tmp_path):
+    cache = ReportCache(max_entries=2, directory=str(tmp_path))
+    cache.put("acme", {"report": "acme"})
+    cache.put("globex", {"report": "globex"})
+
+    # A restart forgets the memory LRU; reading acme back makes it the most recent file
+    cache = ReportCache(max_entries=2, directory=str(tmp_path))
+    assert cache.get("acme") is not None
+    cache.put("initech", {"report": "initech"})
+    assert len(files(tmp_path)) == 2
+    assert cache.stats()["disk_evictions"] == 1
+
+    cache = ReportCache(max_entries=2, directory=str(tmp_path))
+    assert cache.get("globex") is None
+    assert cache.get("acme") is not None and cache.get("initech") is not None
+
+
+def test_startup_drops_expired_files_and_applies_the_limits(clock, tmp_path):
+    cache = ReportCache(max_stale=100, directory=str(tmp_path))
+    for i, key in enumerate(("acme", "globex", "initech")):
+        cache.put(key, {"report": key})
+        os.utime(cache._path(key), (900.0 + i * 100, 900.0 + i * 100))
+
+    # acme (mtime 900) is past max_stale; of the rest only the newest fits max_entries
+    ReportCache(max_stale=100, max_entries=1, directory=str(tmp_path))
+    assert files(tmp_path) == [os.path.basename(cache._path("initech"))]
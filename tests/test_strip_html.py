@@ -0,0 +1,42 @@
+import random
+
+import pytest
+from bs4 import BeautifulSoup
+
+from src.analysis import strip_html
+
+
+SAMPLES = [
+    "",
+    " ",
+    "\n\t ",
+    "Plain summary without markup.",
+    "Tesla shares rose 5% after earnings",
+    "<p>Tesla <b>beats</b> estimates</p>",
+    "AT&amp;T and S&P 500",
+    "AT&T and S&P 500",
+    "a < b and c > d",
+    "<a href=\"https://example.com\">Read more</a>&nbsp;»",
+    "<![CDATA[raw]]> text",
+    "<!-- comment -->visible",
+    "Fish &amp; chips &lt;3",
+    "<br/>line<br>break",
+    "unterminated <b",
+]
+PIECES = ["word", " ", "<b>", "</b>", "&amp;", "&", "<", ">", "&nbsp;", "<p class='x'>", "\n", "é", "&#169;"]
+
+
+def reference(text):
+    return BeautifulSoup(text, "html.parser").get_text()
+
+
+@pytest.mark.parametrize("text", SAMPLES)
+def test_matches_beautifulsoup(text):
+    assert strip_html(text) == reference(text)
+
+
+def test_matches_beautifulsoup_on_random_fragments():
+    rng = random.Random(5)
+    for _ in range(500):
+        text = "".join(rng.choice(PIECES) for _ in range(rng.randint(0, 10)))
+        assert strip_html(text) == reference(text), text
@@ -0,0 +1,66 @@
+from src.topic_index import TopicIndex, source_label
+
+
+def article(topics, sentiment="Neutral", score=0.0):
+    return {"Topics": topics, "Sentiment": sentiment, "Sentiment Score": score}
+
+
+ARTICLES = [
+    article(["Acme", "Globex", "Acme", "Hooli"], "Positive", 0.5),
+    article(["Acme", "Initech"], "Negative", -0.4),
+    article(["Acme", "Globex", "Initech"], "Positive", 0.3),
+    article(["Acme", "Umbrella"]),
+]
+SOURCES = [
+    ["https://one.test/rss"],
+    ["https://two.test/rss"],
+    ["https://one.test/rss", "https://three.test/feed"],
+    ["https://two.test/rss"],
+]
+
+
+def test_counts_positions_and_sentiment():
+    index = TopicIndex.build(ARTICLES)
+    assert len(index) == 5 and index.n_articles == 4
+    # A topic repeated within one article counts once
+    assert index.count("Acme") == 4 and index.positions("Acme") == [0, 1, 2, 3]
+    assert index.positions("Globex") == [0, 2]
+    assert index.count("Missing") == 0 and index.positions("Missing") == []
+    assert index.sentiment("Initech") == {"Positive": 1, "Negative": 1, "Neutral": 0, "Average Score": -0.05}
+    assert index.sentiment("Missing") is None
+
+
+def test_common_topics():
+    assert TopicIndex.build(ARTICLES).common() == ["Acme"]
+    assert TopicIndex.build(ARTICLES[:2] + [article([])]).common() == []
+    assert TopicIndex().common() == []
+
+
+def test_top_shared_orders_by_articles_then_first_seen():
+    index = TopicIndex.build(ARTICLES)
+    assert index.top_shared() == ["Acme", "Globex", "Initech"]
+    assert index.top_shared(k=2) == ["Acme", "Globex"]
+    assert index.top_shared(min_articles=3) == ["Acme"]
+    assert index.top_shared(min_articles=1) == ["Acme", "Globex", "Initech", "Hooli", "Umbrella"]
+
+
+def test_unique_to_source_uses_feed_hosts():
+    index = TopicIndex.build(ARTICLES, SOURCES)
+    assert index.unique_to_source() == {"one.test": ["Hooli"], "two.test": ["Umbrella"]}
+    assert index.summary("Globex") == {
+        "Topic": "Globex",
+        "Articles": 2,
+        "Sources": 2,
+        "Sentiment": {"Positive": 2, "Negative": 0, "Neutral": 0, "Average Score": 0.4},
+    }
+
+
+def test_unique_to_source_needs_two_sources():
+    single = [["https://one.test/rss"]] * len(ARTICLES)
+    assert TopicIndex.build(ARTICLES, single).unique_to_source() == {}
+    assert TopicIndex.build(ARTICLES).unique_to_source() == {}
+
+
+def test_source_label():
+    assert source_label("https://news.google.com/rss/search?q=Acme") == "news.google.com"
+    assert source_label("local-feed") == "local-feed"
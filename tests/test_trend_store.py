@@ -0,0 +1,100 @@
+import random
+
+import pytest
+
+from src.trend_store import BUCKET_SECONDS, LABELS, WINDOWS, TrendStore, bucket_of
+
+
+NOW = 1_700_000_000.0
+DAY = 24 * 3600
+
+
+@pytest.fixture
+def store(tmp_path):
+    trend_store = TrendStore(str(tmp_path / "trends.sqlite3"))
+    yield trend_store
+    trend_store.close()
+
+
+def brute_force(points, now):
+    """Window aggregates recomputed from the raw points."""
+    expected = {}
+    for name, seconds in WINDOWS.items():
+        start = bucket_of(now) - seconds + BUCKET_SECONDS
+        selected = [
+            (compound, label) for published, compound, label in points
+            if bucket_of(published) >= start
+        ]
+        scores = [compound for compound, _ in selected if compound is not None]
+        expected[name] = {
+            "articles": len(selected),
+            "sentiment": {label: sum(1 for _, l in selected if l == label) for label in LABELS},
+            "mean_compound": round(sum(scores) / len(scores), 4) if scores else None,
+        }
+    return expected
+
+
+def assert_windows(actual, expected):
+    for name in WINDOWS:
+        assert actual[name]["articles"] == expected[name]["articles"], name
+        assert actual[name]["sentiment"] == expected[name]["sentiment"], name
+        if expected[name]["mean_compound"] is None:
+            assert actual[name]["mean_compound"] is None, name
+        else:
+            assert actual[name]["mean_compound"] == pytest.approx(expected[name]["mean_compound"], abs=1e-3), name
+
+
+def test_windows_match_brute_force_across_slides(store):
+    rng = random.Random(7)
+    points = []
+    now = NOW
+    for step in range(40):
+        batch = [
+            (f"k{step}-{i}", now - rng.uniform(0, 9 * DAY), rng.choice([rng.uniform(-1, 1), None]), rng.choice(LABELS))
+            for i in range(rng.randint(0, 30))
+        ]
+        store.add("acme", batch, now=now)
+        points.extend((published, compound, label) for _, published, compound, label in batch)
+        assert_windows(store.trend("acme", now=now)["windows"], brute_force(points, now))
+        now += rng.choice([60, 290, 1800, 4 * 3600, DAY])
+
+
+def test_duplicate_keys_are_counted_once(store):
+    point = ("k1", NOW - 60, 0.5, "Positive")
+    assert store.add("acme", [point], now=NOW) == 1
+    assert store.add("acme", [point], now=NOW) == 0
+    assert store.trend("acme", now=NOW)["windows"]["1h"]["articles"] == 1
+
+
+def test_prune_keeps_windows_consistent(store):
+    old = NOW - 20 * DAY
+    store.add("acme", [("k1", old, 0.5, "Positive")], now=old)
+    store.prune(7 * DAY, now=NOW)
+
+    trend = store.trend("acme", now=NOW)
+    assert trend is not None
+    assert_windows(trend["windows"], brute_force([], NOW))
+
+    store.add("acme", [("k2", NOW, -0.5, "Negative")], now=NOW)
+    assert_windows(store.trend("acme", now=NOW)["windows"], brute_force([(NOW, -0.5, "Negative")], NOW))
+
+
+def test_windows_match_brute_force_across_prunes(store):
+    rng = random.Random(11)
+    points = []
+    now = NOW
+    for step in range(30):
+        batch = [
+            (f"k{step}-{i}", now - rng.uniform(0, 3 * DAY), rng.uniform(-1, 1), rng.choice(LABELS))
+            for i in range(rng.randint(1, 10))
+        ]
+        store.add("acme", batch, now=now)
+        points.extend((published, compound, label) for _, published, compound, label in batch)
+        now += rng.choice([3600, DAY, 3 * DAY])
+        if step % 5 == 4:
+            store.prune(7 * DAY, now=now)
+        assert_windows(store.trend("acme", now=now)["windows"], brute_force(points, now))
+
+
+def test_unknown_company_has_no_trend(store):
+    assert store.trend("nobody", now=NOW) is None